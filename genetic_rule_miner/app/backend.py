@@ -1,5 +1,4 @@
 import logging
-from io import StringIO
 from typing import Any, Dict, Set, cast
 
 import diskcache
@@ -345,17 +344,8 @@ def get_anime_data_cached(anime_ids: Set[int]) -> pd.DataFrame:
                 "El objeto devuelto por get_anime_by_ids no tiene 'getvalue'."
             )
 
-        buffer_content = anime_buffer.getvalue()
-        if not isinstance(buffer_content, (bytes, str)):
-            raise ValueError("El contenido del buffer no es bytes ni str.")
-
-        content_str = (
-            buffer_content.decode("utf-8")
-            if isinstance(buffer_content, bytes)
-            else buffer_content
-        )
-
-        anime_df = pd.read_csv(StringIO(content_str))
+        # read_csv decodes BytesIO and StringIO buffers alike, without copying
+        anime_df = pd.read_csv(anime_buffer)
         anime_df = preprocess_data(anime_df)
 
         anime_cache.set(key, anime_df, expire=ANIME_CACHE_TTL)
@@ -438,9 +428,7 @@ def api_get_anime_detail(anime_id: int):
         anime_df = anime_cache[key]
     else:
         anime_buffer = anime_service.get_anime_by_ids([anime_id])
-        anime_df = pd.read_csv(
-            StringIO(anime_buffer.getvalue().decode("utf-8"))
-        )
+        anime_df = pd.read_csv(anime_buffer)
         anime_df = preprocess_data(anime_df)
         anime_cache.set(key, anime_df, expire=ANIME_CACHE_TTL)
 
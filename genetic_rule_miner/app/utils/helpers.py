@@ -1,10 +1,13 @@
+from itertools import islice
+
+
 def update_controls(query, full_series_list, checkbox_map, search_bar_ref):
     """
     Update the search bar controls based on a query.
 
     Filters a list of series names using the provided query (case-insensitive),
     updates the search bar with the first 10 matching results, and refreshes
-    the displayed controls.
+    the displayed controls. The scan stops as soon as 10 matches are found.
 
     Args:
         query (str): The text input used to filter the series list.
@@ -18,6 +21,8 @@ def update_controls(query, full_series_list, checkbox_map, search_bar_ref):
         None
     """
     lower_query = query.lower()
-    filtered = [s for s in full_series_list if lower_query in s.lower()][:10]
+    filtered = islice(
+        (s for s in full_series_list if lower_query in s.lower()), 10
+    )
     search_bar_ref.current.controls = [checkbox_map[s] for s in filtered]
     search_bar_ref.current.update()
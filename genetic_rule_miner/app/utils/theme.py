@@ -1,3 +1,5 @@
+from functools import cache
+
 from flet import Colors, ColorScheme, Page, Theme, ThemeMode
 
 
@@ -22,6 +24,7 @@ def setup_theme(page: Page):
     page.update()
 
 
+@cache
 def get_light_theme() -> Theme:
     """
     Define and return a custom light theme.
@@ -29,6 +32,8 @@ def get_light_theme() -> Theme:
     The light theme uses a white background, dark text,
     and purple as the primary/secondary accent color.
 
+    The theme is built once and shared by every page.
+
     Returns:
         Theme: A custom Flet Theme object for light mode.
     """
@@ -50,6 +55,7 @@ def get_light_theme() -> Theme:
     )
 
 
+@cache
 def get_dark_theme() -> Theme:
     """
     Define and return a custom dark theme with improved contrast.
@@ -57,6 +63,8 @@ def get_dark_theme() -> Theme:
     The dark theme uses a dark background with light text
     and adjusted surface colors to ensure readability.
 
+    The theme is built once and shared by every page.
+
     Returns:
         Theme: A custom Flet Theme object for dark mode.
     """
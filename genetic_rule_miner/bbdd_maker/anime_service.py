@@ -1,18 +1,92 @@
+import asyncio
+import atexit
+import csv
 import logging
-import time
-from io import BytesIO
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO, TextIOWrapper
 from typing import Optional
 
-import pandas as pd
+import aiohttp
+import orjson
 import requests
-from rake_nltk import Rake
+from aiolimiter import AsyncLimiter
 
 from genetic_rule_miner.config import APIConfig
+from genetic_rule_miner.utils.http_client import (
+    MISSING,
+    NotFoundCache,
+    ResponseCache,
+    async_sleep_backoff,
+    build_session,
+    sleep_backoff,
+)
 from genetic_rule_miner.utils.logging import LogManager
+from genetic_rule_miner.utils.nltk_aux import try_extract_keywords
 
 LogManager.configure()
 logger = logging.getLogger(__name__)
 
+# Keyword extraction only moves to worker processes for batches large enough
+# to amortise spawning them.
+KEYWORD_CHUNKSIZE = 32
+MIN_PARALLEL_SYNOPSES = 256
+
+# Worker pool shared by every AnimeService in the process, so interpreter
+# start-up and the NLTK/RAKE imports are paid once, not per batch.
+_keyword_executor: Optional[ProcessPoolExecutor] = None
+_keyword_executor_lock = threading.Lock()
+
+# Requests in flight at once; the per-second budget is the limiter's job.
+MAX_CONCURRENCY = 5
+
+
+def _get_keyword_executor() -> ProcessPoolExecutor:
+    """
+    Return the shared keyword worker pool, creating it on first use.
+
+    The pool is shut down when the interpreter exits.
+    """
+    global _keyword_executor
+    if _keyword_executor is None:
+        with _keyword_executor_lock:
+            if _keyword_executor is None:
+                _keyword_executor = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                atexit.register(_keyword_executor.shutdown)
+    return _keyword_executor
+
+
+# Column order of the CSV produced by `AnimeService.get_anime_by_ids`.
+COLUMNS = (
+    "anime_id",
+    "name",
+    "english_name",
+    "japanese_name",
+    "score",
+    "genres",
+    "keywords",
+    "type",
+    "episodes",
+    "aired",
+    "premiered",
+    "status",
+    "producers",
+    "studios",
+    "source",
+    "duration",
+    "rating",
+    "rank",
+    "popularity",
+    "favorites",
+    "scored_by",
+    "members",
+)
+
 
 class AnimeService:
     """
@@ -26,6 +100,8 @@ class AnimeService:
     Attributes:
         config (APIConfig): Configuration object with API details such as
             base URL, timeout, and retry settings.
+        session (requests.Session): Pooled HTTP session reused across calls.
+        cache (ResponseCache): Recently fetched anime, keyed by MAL ID.
     """
 
     def __init__(self, config: APIConfig = APIConfig()):
@@ -37,6 +113,12 @@ class AnimeService:
                 Defaults to a new instance of APIConfig.
         """
         self.config = config
+        self.session = build_session()
+        self.cache = ResponseCache(config.cache_maxsize, config.cache_ttl)
+        self.not_found = NotFoundCache(
+            os.path.join(config.cache_dir, "anime_not_found.pkl"),
+            config.not_found_ttl,
+        )
         logger.info("AnimeService initialized with config: %s", self.config)
 
     def _fetch_anime(self, anime_id: int) -> Optional[dict]:
@@ -52,6 +134,11 @@ class AnimeService:
             Optional[dict]: Anime data as a dictionary, or None if not found
             or after exceeding the maximum retries.
         """
+        if (cached := self.cache.get(anime_id)) is not MISSING:
+            return cached
+        if anime_id in self.not_found:
+            logger.debug("Anime with ID %d is known to be missing", anime_id)
+            return None
         for attempt in range(self.config.max_retries):
             try:
                 logger.debug(
@@ -59,7 +146,7 @@ class AnimeService:
                     anime_id,
                     attempt + 1,
                 )
-                response = requests.get(
+                response = self.session.get(
                     f"{self.config.base_url}anime/{anime_id}",
                     timeout=self.config.timeout,
                 )
@@ -68,11 +155,88 @@ class AnimeService:
                         "Anime with ID %d not found (404). Skipping further attempts.",
                         anime_id,
                     )
+                    self.cache.set(anime_id, None)
+                    self.not_found.add(anime_id)
                     return None
                 response.raise_for_status()
                 logger.debug("Successfully fetched anime with ID %d", anime_id)
-                return response.json().get("data")
-            except requests.RequestException as e:
+                data = orjson.loads(response.content).get("data")
+                self.cache.set(anime_id, data)
+                return data
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
+                logger.warning(
+                    "Failed to fetch anime with ID %d on attempt %d: %s",
+                    anime_id,
+                    attempt + 1,
+                    e,
+                )
+
+                if attempt < self.config.max_retries - 1:
+                    logger.debug("Waiting before the next attempt...")
+                    sleep_backoff(attempt, getattr(e, "response", None))
+        logger.error(
+            "Failed to fetch anime with ID %d after %d attempts",
+            anime_id,
+            self.config.max_retries,
+        )
+        return None
+
+    async def _fetch_anime_async(
+        self,
+        session: aiohttp.ClientSession,
+        limiter: AsyncLimiter,
+        anime_id: int,
+    ) -> Optional[dict]:
+        """
+        Fetch anime data from the API by its ID without blocking the event loop.
+
+        Mirrors `_fetch_anime`: a 404 short-circuits and any other failure is
+        retried with exponential backoff. Every attempt takes a token from the
+        shared limiter first.
+
+        Args:
+            session (aiohttp.ClientSession): Shared HTTP session.
+            limiter (AsyncLimiter): Rate limiter shared by all requests.
+            anime_id (int): The MAL ID of the anime.
+
+        Returns:
+            Optional[dict]: Anime data as a dictionary, or None if not found
+            or after exceeding the maximum retries.
+        """
+        if (cached := self.cache.get(anime_id)) is not MISSING:
+            return cached
+        if anime_id in self.not_found:
+            logger.debug("Anime with ID %d is known to be missing", anime_id)
+            return None
+        url = f"{self.config.base_url}anime/{anime_id}"
+        for attempt in range(self.config.max_retries):
+            try:
+                logger.debug(
+                    "Fetching anime with ID %d (Attempt %d)",
+                    anime_id,
+                    attempt + 1,
+                )
+                async with limiter:
+                    async with session.get(url) as response:
+                        if response.status == 404:
+                            logger.warning(
+                                "Anime with ID %d not found (404). Skipping further attempts.",
+                                anime_id,
+                            )
+                            self.cache.set(anime_id, None)
+                            self.not_found.add(anime_id)
+                            return None
+                        response.raise_for_status()
+                        payload = orjson.loads(await response.read())
+                logger.debug("Successfully fetched anime with ID %d", anime_id)
+                data = payload.get("data")
+                self.cache.set(anime_id, data)
+                return data
+            except (
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                orjson.JSONDecodeError,
+            ) as e:
                 logger.warning(
                     "Failed to fetch anime with ID %d on attempt %d: %s",
                     anime_id,
@@ -82,7 +246,7 @@ class AnimeService:
 
                 if attempt < self.config.max_retries - 1:
                     logger.debug("Waiting before the next attempt...")
-                    time.sleep(2**attempt)  # Exponential backoff
+                    await async_sleep_backoff(attempt, e)
         logger.error(
             "Failed to fetch anime with ID %d after %d attempts",
             anime_id,
@@ -90,6 +254,60 @@ class AnimeService:
         )
         return None
 
+    async def _gather_all(self, mal_ids: list[int]) -> list[Optional[dict]]:
+        """
+        Fetch several anime concurrently under the API rate limit.
+
+        Args:
+            mal_ids (list[int]): List of MAL IDs to fetch.
+
+        Returns:
+            list[Optional[dict]]: Anime data in the same order as `mal_ids`.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        limiter = AsyncLimiter(self.config.rate_limit, 1)
+        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+
+            async def bounded(anime_id: int) -> Optional[dict]:
+                async with semaphore:
+                    return await self._fetch_anime_async(
+                        session, limiter, anime_id
+                    )
+
+            return await asyncio.gather(*(bounded(i) for i in mal_ids))
+
+    def _extract_keywords(
+        self, synopses: list[str]
+    ) -> list[tuple[str, Optional[str]]]:
+        """
+        Extract keywords for many synopses, in parallel for large batches.
+
+        RAKE is pure-Python CPU work, so big batches are spread across the
+        shared worker pool; small ones run inline so short-lived callers never
+        start it.
+
+        Args:
+            synopses (list[str]): Synopses to process, possibly empty.
+
+        Returns:
+            list[tuple[str, Optional[str]]]: (keywords, error) pairs in the
+            same order as `synopses`.
+        """
+        if len(synopses) < MIN_PARALLEL_SYNOPSES:
+            return [try_extract_keywords(s) for s in synopses]
+
+        logger.info(
+            "Extracting keywords for %d synopses in worker processes",
+            len(synopses),
+        )
+        return list(
+            _get_keyword_executor().map(
+                try_extract_keywords, synopses, chunksize=KEYWORD_CHUNKSIZE
+            )
+        )
+
     def get_anime_by_id(self, mal_id: int) -> Optional[dict]:
         """
         Get the details of a single anime by its MAL ID.
@@ -118,61 +336,61 @@ class AnimeService:
         """
         logger.info("Fetching anime data for %d IDs", len(mal_ids))
         buffer = BytesIO()
-        records = []
-        r = Rake()
+        text_buffer = TextIOWrapper(
+            buffer, encoding="utf-8", newline="", write_through=True
+        )
+        writer = csv.writer(text_buffer, lineterminator="\n")
+        writer.writerow(COLUMNS)
+        results = asyncio.run(self._gather_all(mal_ids))
+        self.not_found.flush()
+        fetched = [
+            (anime_id, data)
+            for anime_id, data in zip(mal_ids, results)
+            if data
+        ]
+        all_keywords = self._extract_keywords(
+            [data.get("synopsis") or "" for _, data in fetched]
+        )
 
-        for anime_id in mal_ids:
+        for (anime_id, data), (keywords, error) in zip(fetched, all_keywords):
             logger.debug("Processing anime ID %d", anime_id)
-            data = self._fetch_anime(anime_id)
-            if data:
-                synopsis = data.get("synopsis", "")
-                keywords = ""
-                if synopsis:
-                    try:
-                        r.extract_keywords_from_text(synopsis)
-                        keywords = ", ".join(r.get_ranked_phrases())
-                    except Exception as e:
-                        logger.error(
-                            "Keyword extraction failed for anime ID %d: %s",
-                            anime_id,
-                            e,
-                        )
-
-                records.append(
-                    {
-                        "anime_id": anime_id,
-                        "name": data.get("title"),
-                        "english_name": data.get("title_english"),
-                        "japanese_name": data.get("title_japanese"),
-                        "score": data.get("score"),
-                        "genres": ", ".join(
-                            [g["name"] for g in data.get("genres", [])]
-                        ),
-                        "keywords": keywords,
-                        "type": data.get("type"),
-                        "episodes": data.get("episodes"),
-                        "aired": data.get("aired", {}).get("string"),
-                        "premiered": f"{data.get('season', '')} {data.get('year', '')}".strip(),
-                        "status": data.get("status"),
-                        "producers": ", ".join(
-                            [p["name"] for p in data.get("producers", [])]
-                        ),
-                        "studios": ", ".join(
-                            [s["name"] for s in data.get("studios", [])]
-                        ),
-                        "source": data.get("source"),
-                        "duration": data.get("duration"),
-                        "rating": data.get("rating"),
-                        "rank": data.get("rank"),
-                        "popularity": data.get("popularity"),
-                        "favorites": data.get("favorites"),
-                        "scored_by": data.get("scored_by"),
-                        "members": data.get("members"),
-                    }
+            if error:
+                logger.error(
+                    "Keyword extraction failed for anime ID %d: %s",
+                    anime_id,
+                    error,
+                )
+            season = data.get("season") or ""
+            year = data.get("year") or ""
+            writer.writerow(
+                (
+                    anime_id,
+                    data.get("title"),
+                    data.get("title_english"),
+                    data.get("title_japanese"),
+                    data.get("score"),
+                    ", ".join(g["name"] for g in data.get("genres", ())),
+                    keywords,
+                    data.get("type"),
+                    data.get("episodes"),
+                    data.get("aired", {}).get("string"),
+                    f"{season} {year}".strip(),
+                    data.get("status"),
+                    ", ".join(p["name"] for p in data.get("producers", ())),
+                    ", ".join(s["name"] for s in data.get("studios", ())),
+                    data.get("source"),
+                    data.get("duration"),
+                    data.get("rating"),
+                    data.get("rank"),
+                    data.get("popularity"),
+                    data.get("favorites"),
+                    data.get("scored_by"),
+                    data.get("members"),
                 )
+            )
 
-        df = pd.DataFrame(records)
-        df.to_csv(buffer, index=False)
+        # Detach so the wrapper does not close the buffer when collected
+        text_buffer.detach()
         buffer.seek(0)
         logger.info("Anime data written to buffer")
         return buffer
@@ -1,17 +1,31 @@
+import asyncio
 import csv
 import logging
 import time
-from io import BytesIO, StringIO
+from io import BytesIO, TextIOWrapper
 from typing import List, Optional
 
-import requests
+import aiohttp
+import orjson
+from aiolimiter import AsyncLimiter
 
 from genetic_rule_miner.config import APIConfig
+from genetic_rule_miner.utils.http_client import (
+    MISSING,
+    ResponseCache,
+    async_sleep_backoff,
+    build_session,
+    is_terminal_status,
+    sleep_backoff,
+)
 from genetic_rule_miner.utils.logging import LogManager
 
 LogManager.configure()
 logger = logging.getLogger(__name__)
 
+# Users between progress messages while fetching a batch
+PROGRESS_LOG_EVERY = 100
+
 
 class DetailsService:
     def __init__(self, config: APIConfig = APIConfig()):
@@ -23,10 +37,10 @@ class DetailsService:
             config (APIConfig, optional): API configuration. Defaults to APIConfig().
         """
         # Parameter optimization
-        self.batch_size = 3
-        self.request_delay = 0.35
-        self.batch_delay = 1.0
+        self.max_concurrency = 5
         self.max_retries = 3
+        self.session = build_session()
+        self.cache = ResponseCache(config.cache_maxsize, config.cache_ttl)
 
         logger.info("DetailsService initialized with default configuration.")
 
@@ -34,8 +48,8 @@ class DetailsService:
         """
         Generate a CSV file with detailed user data.
 
-        This method fetches details for multiple users, processes them in batches,
-        applies rate limiting, and writes the results into a CSV buffer.
+        This method fetches details for multiple users concurrently, applies
+        rate limiting, and writes the results into a CSV buffer in input order.
 
         Args:
             usernames (List[str]): List of MyAnimeList usernames.
@@ -44,8 +58,11 @@ class DetailsService:
             BytesIO: A buffer containing the CSV data.
         """
         logger.info(f"Starting processing for {len(usernames)} users.")
-        buffer = StringIO()
-        writer = csv.writer(buffer)
+        buffer = BytesIO()
+        text_buffer = TextIOWrapper(
+            buffer, encoding="utf-8", newline="", write_through=True
+        )
+        writer = csv.writer(text_buffer)
         writer.writerow(
             [
                 "Mal ID",
@@ -67,29 +84,53 @@ class DetailsService:
             ]
         )
 
-        total = len(usernames)
         start_time = time.time()
+        results = asyncio.run(self._gather_all(usernames))
 
-        for i in range(0, total, self.batch_size):
-            batch = usernames[i : i + self.batch_size]
-            logger.debug(
-                f"Processing batch {i // self.batch_size + 1}: {batch}"
-            )
-            batch_data = []
-
-            for username in batch:
-                if data := self._fetch_user_data(username):
-                    writer.writerow(data)
-                    batch_data.append(data)
-                else:
-                    logger.warning(f"No data found for user: {username}")
-
-            logger.info(f"Processed {min(i+self.batch_size, total)}/{total}")
-            self._handle_rate_limits(len(batch_data))
+        rows = []
+        for username, data in zip(usernames, results):
+            if data:
+                rows.append(data)
+            else:
+                logger.warning(f"No data found for user: {username}")
+        writer.writerows(rows)
 
         logger.info(f"Total processing time: {time.time()-start_time:.2f}s")
+        # Detach so the wrapper does not close the buffer when collected
+        text_buffer.detach()
         buffer.seek(0)
-        return BytesIO(buffer.getvalue().encode("utf-8"))
+        return buffer
+
+    async def _gather_all(self, usernames: List[str]) -> List[Optional[list]]:
+        """
+        Fetch several users concurrently under the API rate limit.
+
+        Args:
+            usernames (List[str]): List of MyAnimeList usernames.
+
+        Returns:
+            List[Optional[list]]: User details in the same order as `usernames`.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limiter = AsyncLimiter(self.config.rate_limit, 1)
+        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+        total = len(usernames)
+        done = 0
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+
+            async def bounded(username: str) -> Optional[list]:
+                nonlocal done
+                async with semaphore:
+                    data = await self._fetch_user_data_async(
+                        session, limiter, username
+                    )
+                done += 1
+                if done % PROGRESS_LOG_EVERY == 0 or done == total:
+                    logger.info("Processed %d/%d", done, total)
+                return data
+
+            return await asyncio.gather(*(bounded(u) for u in usernames))
 
     def _fetch_user_data(self, username: str) -> Optional[list]:
         """
@@ -102,11 +143,13 @@ class DetailsService:
             Optional[list]: A list of user attributes (if found),
                 or None if the user does not exist or all retries fail.
         """
+        if (cached := self.cache.get(username)) is not MISSING:
+            return cached
         logger.debug(f"Requesting data for user: {username}")
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(
-                    f"https://api.jikan.moe/v4/users/{username}/full",
+                response = self.session.get(
+                    f"{self.config.base_url}users/{username}/full",
                     timeout=self.config.timeout,
                 )
 
@@ -114,24 +157,101 @@ class DetailsService:
                     logger.debug(
                         f"Successfully retrieved data for {username}."
                     )
-                    return self._parse_response(response.json())
+                    data = self._parse_response(orjson.loads(response.content))
+                    self.cache.set(username, data)
+                    return data
 
                 if response.status_code == 404:
                     logger.info(
                         f"User not found: {username}. Skipping further attempts."
                     )
+                    self.cache.set(username, None)
+                    return None
+
+                if is_terminal_status(response.status_code):
+                    logger.warning(
+                        f"Request for {username} rejected (HTTP {response.status_code}). Skipping further attempts."
+                    )
                     return None
 
                 logger.warning(
                     f"Attempt {attempt+1} failed for {username} (HTTP {response.status_code})."
                 )
-                time.sleep(2**attempt)
+                sleep_backoff(attempt, response)
+
+            except Exception as e:
+                logger.error(
+                    f"Error on attempt {attempt+1} for {username}: {str(e)}"
+                )
+                sleep_backoff(attempt)
+
+        logger.error(f"All attempts to fetch data for {username} failed.")
+        return None
+
+    async def _fetch_user_data_async(
+        self,
+        session: aiohttp.ClientSession,
+        limiter: AsyncLimiter,
+        username: str,
+    ) -> Optional[list]:
+        """
+        Fetch user details without blocking the event loop.
+
+        Mirrors `_fetch_user_data`, taking a token from the shared limiter
+        before each request.
+
+        Args:
+            session (aiohttp.ClientSession): Shared HTTP session.
+            limiter (AsyncLimiter): Rate limiter shared by all requests.
+            username (str): The MyAnimeList username to fetch.
+
+        Returns:
+            Optional[list]: A list of user attributes (if found),
+                or None if the user does not exist or all retries fail.
+        """
+        if (cached := self.cache.get(username)) is not MISSING:
+            return cached
+        logger.debug(f"Requesting data for user: {username}")
+        url = f"{self.config.base_url}users/{username}/full"
+        for attempt in range(self.max_retries):
+            try:
+                async with limiter:
+                    async with session.get(url) as response:
+                        status = response.status
+                        if status == 200:
+                            payload = orjson.loads(await response.read())
+
+                if status == 200:
+                    logger.debug(
+                        f"Successfully retrieved data for {username}."
+                    )
+                    data = self._parse_response(payload)
+                    self.cache.set(username, data)
+                    return data
+
+                if status == 404:
+                    logger.info(
+                        f"User not found: {username}. Skipping further attempts."
+                    )
+                    self.cache.set(username, None)
+                    return None
+
+                if is_terminal_status(status):
+                    logger.warning(
+                        f"Request for {username} rejected (HTTP {status}). Skipping further attempts."
+                    )
+                    return None
+
+                logger.warning(
+                    f"Attempt {attempt+1} failed for {username} (HTTP {status})."
+                )
+                await async_sleep_backoff(attempt, response)
 
             except Exception as e:
                 logger.error(
                     f"Error on attempt {attempt+1} for {username}: {str(e)}"
                 )
-                time.sleep(2**attempt)
+                await async_sleep_backoff(attempt)
 
         logger.error(f"All attempts to fetch data for {username} failed.")
         return None
@@ -169,19 +289,6 @@ class DetailsService:
             stats.get("episodes_watched"),
         ]
 
-    def _handle_rate_limits(self, batch_size: int):
-        """
-        Apply delays to respect API rate limits.
-
-        Args:
-            batch_size (int): Number of successfully processed users in the batch.
-        """
-        if batch_size > 0:
-            logger.debug(
-                f"Applying a delay of {self.batch_delay}s to respect API rate limits."
-            )
-            time.sleep(self.batch_delay)
-
     def get_user_detail(self, username: str) -> Optional[list]:
         """
         Get details for a single user.
@@ -6,6 +6,7 @@ import time
 from io import BytesIO, StringIO
 
 import numpy as np
+import orjson
 import pandas as pd
 
 from genetic_rule_miner.bbdd_maker.anime_service import AnimeService
@@ -58,6 +59,10 @@ def convert_text_to_list_column(df, column_name):
     df[column_name] = df[column_name].fillna("[]").apply(parse_cell)
 
 
+# List-valued columns, stored as TEXT[] in the database
+ARRAY_COLUMNS = ("producers", "genres", "keywords")
+
+
 # Call the function only on the first execution
 download_nltk_resources()
 
@@ -130,6 +135,15 @@ def preprocess_to_memory(
     df = preprocess_data(df)
     df.dropna(how="all", inplace=True)
     df = df.where(pd.notnull(df), None)
+    # Lists are written as JSON, which the loader parses much faster than
+    # Python literals
+    for col in ARRAY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].map(
+                lambda v: orjson.dumps(v).decode()
+                if isinstance(v, list)
+                else v
+            )
     csv_buffer = StringIO()
     df.to_csv(csv_buffer, index=False, header=True, na_rep="\\N")
     csv_buffer.seek(0)
@@ -257,9 +271,7 @@ def main():
     try:
         logger.info("📥 Starting user data loading...")
 
-        details_df = pd.read_csv(
-            StringIO(details_buffer.getvalue().decode("utf-8"))
-        )
+        details_df = pd.read_csv(details_buffer)
         details_df.rename(
             columns={
                 "Mal ID": "mal_id",
@@ -324,7 +336,10 @@ def main():
             logger.info("📡 Retrieving user scores...")
             score_service = ScoreService(api_config)
             scores_buffer = score_service.get_scores(users_csv_buffer)
-            if hasattr(scores_buffer, "getvalue") and scores_buffer.getvalue():
+            if (
+                hasattr(scores_buffer, "getbuffer")
+                and scores_buffer.getbuffer().nbytes
+            ):
                 logger.info("✅ Successfully retrieved scores data")
                 break
             else:
@@ -346,9 +361,7 @@ def main():
             return
 
         # 8. Procesar y subir datos de anime
-        anime_df = pd.read_csv(
-            StringIO(anime_buffer.getvalue().decode("utf-8"))
-        )
+        anime_df = pd.read_csv(anime_buffer)
         anime_df["premiered"] = anime_df["premiered"].apply(clean_premiered)
 
         anime_buffer_proc = preprocess_to_memory(
@@ -393,9 +406,7 @@ def main():
                 db.copy_from_buffer(conn, anime_buffer_proc, "anime_dataset")
 
         # 9. Procesar y subir scores (solo después de usuarios y animes)
-        scores_df = pd.read_csv(
-            StringIO(scores_buffer.getvalue().decode("utf-8"))
-        )
+        scores_df = pd.read_csv(scores_buffer)
         scores_df.rename(
             columns={
                 "User ID": "user_id",
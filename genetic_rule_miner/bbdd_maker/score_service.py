@@ -1,21 +1,46 @@
+import asyncio
 import csv
-import json
 import logging
-import random
-import time
-from io import BytesIO, StringIO
+from io import BytesIO, TextIOWrapper
 from typing import List, Optional
 
+import aiohttp
+import orjson
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from aiolimiter import AsyncLimiter
+from bs4 import BeautifulSoup, SoupStrainer
 
 from genetic_rule_miner.config import APIConfig
+from genetic_rule_miner.utils.http_client import (
+    MISSING,
+    ResponseCache,
+    async_sleep_backoff,
+    build_session,
+    is_terminal_status,
+    sleep_backoff,
+)
 from genetic_rule_miner.utils.logging import LogManager
 
 LogManager.configure()
 logger = logging.getLogger(__name__)
 
+MAL_URL = "https://myanimelist.net"
+
+# Only tables are turned into Tag objects; the rest of the page is skipped
+SCORE_TABLES = SoupStrainer("table")
+LEGACY_TABLE_ATTRS = {
+    "border": "0",
+    "cellpadding": "0",
+    "cellspacing": "0",
+    "width": "100%",
+}
+# Legacy list rows have at least five cells: the title link sits in the
+# second one and the score label in the third
+LEGACY_ROWS = sv.compile("tr:has(> td:nth-of-type(5))")
+ANIME_LINK = sv.compile(":scope > td:nth-of-type(2) a.animetitle")
+SCORE_LABEL = sv.compile(":scope > td:nth-of-type(3) span.score-label")
+
 
 class ScoreService:
     """
@@ -23,10 +48,12 @@ class ScoreService:
 
     Attributes:
         config (APIConfig): Configuration for requests, retries, and delays.
+        session (requests.Session): Pooled HTTP session reused across calls.
+        cache (ResponseCache): Recently scraped score lists, keyed by user.
         status_code (int): MAL status code to filter completed anime.
         batch_size (int): Number of users to process per batch.
-        min_delay (int): Minimum delay between batches (seconds).
-        max_delay (int): Maximum delay between batches (seconds).
+        requests_per_minute (int): Request budget towards MyAnimeList,
+            spread evenly by a token-bucket limiter.
     """
 
     def __init__(self, config: APIConfig = APIConfig()):
@@ -38,37 +65,51 @@ class ScoreService:
                 timeout, and request delays. Defaults to APIConfig().
         """
         self.config = config
+        self.session = build_session()
+        self.cache = ResponseCache(config.cache_maxsize, config.cache_ttl)
 
         # Scraping configuration
         self.status_code = 7  # Completed anime
         self.batch_size = 50
-        self.min_delay = 90
-        self.max_delay = 120
+        self.requests_per_minute = 60
         logger.info("ScoreService initialized with default configuration.")
 
-    def _process_batch(self, users_batch: List[dict]) -> List[list]:
+    async def _process_batch(
+        self,
+        session: aiohttp.ClientSession,
+        limiter: AsyncLimiter,
+        users_batch: List[dict],
+    ) -> List[list]:
         """
-        Process a batch of users and retrieve their scores.
+        Process a batch of users concurrently and retrieve their scores.
 
         Args:
+            session (aiohttp.ClientSession): Shared HTTP session.
+            limiter (AsyncLimiter): Rate limiter shared by all requests.
             users_batch (List[dict]): List of user dictionaries with 'username' and 'mal_id'.
 
         Returns:
             List[list]: List of score records for the batch.
         """
         logger.info(f"Processing batch of {len(users_batch)} users.")
+        results = await asyncio.gather(
+            *(
+                self._scrape_user_scores_async(
+                    session, limiter, user["username"], user["mal_id"]
+                )
+                for user in users_batch
+            ),
+            return_exceptions=True,
+        )
         batch_data = []
-        for user in users_batch:
-            try:
-                if data := self._scrape_user_scores(
-                    user["username"], user["mal_id"]
-                ):
-                    batch_data.extend(data)
-                    logger.info(f"Data retrieved for {user['username']}.")
-                else:
-                    logger.warning(f"No data for {user['username']}.")
-            except Exception as e:
-                logger.error(f"Error processing {user['username']}: {str(e)}")
+        for user, data in zip(users_batch, results):
+            if isinstance(data, Exception):
+                logger.error(f"Error processing {user['username']}: {str(data)}")
+            elif data:
+                batch_data.extend(data)
+                logger.info(f"Data retrieved for {user['username']}.")
+            else:
+                logger.warning(f"No data for {user['username']}.")
         logger.info(
             f"Batch processed with {len(batch_data)} records retrieved."
         )
@@ -87,25 +128,45 @@ class ScoreService:
         Returns:
             Optional[List[list]]: List of [user_id, username, anime_id, anime_title, score] records.
         """
+        if (cached := self.cache.get((username, user_id))) is not MISSING:
+            return cached
         logger.debug(f"Starting scraping for user: {username}.")
         for attempt in range(self.config.max_retries):
             try:
-                url = f"https://myanimelist.net/animelist/{username}?status={self.status_code}"
-                response = requests.get(url, timeout=self.config.timeout)
+                url = f"{MAL_URL}/animelist/{username}?status={self.status_code}"
+                response = self.session.get(url, timeout=self.config.timeout)
 
                 if response.status_code == 200:
                     logger.debug(
                         f"Successfully retrieved HTML for {username}."
                     )
-                    soup = BeautifulSoup(response.content, "html.parser")
-                    return self._parse_modern_table(
-                        soup, user_id, username
-                    ) or self._parse_legacy_tables(soup, user_id, username)
+                    # Only trust a declared charset; requests guesses
+                    # ISO-8859-1 for text/html otherwise
+                    content_type = response.headers.get("Content-Type", "")
+                    data = self._parse_scores(
+                        response.content,
+                        (
+                            response.encoding
+                            if "charset=" in content_type
+                            else None
+                        ),
+                        user_id,
+                        username,
+                    )
+                    self.cache.set((username, user_id), data)
+                    return data
 
                 if response.status_code == 404:
                     logger.info(
                         f"User not found: {username}. Skipping further attempts."
                     )
+                    self.cache.set((username, user_id), None)
+                    return None
+
+                if is_terminal_status(response.status_code):
+                    logger.warning(
+                        f"Request for {username} rejected (HTTP {response.status_code}). Skipping further attempts."
+                    )
                     return None
 
                 if response.status_code == 429:
@@ -113,124 +174,206 @@ class ScoreService:
                         f"Rate limit exceeded for {username}. Retrying..."
                     )
                 else:
-                    return None
-                time.sleep(2**attempt)
+                    logger.warning(
+                        f"Attempt {attempt+1} failed for {username} (HTTP {response.status_code})."
+                    )
+                sleep_backoff(attempt, response)
 
             except Exception as e:
                 logger.error(
                     f"Error on attempt {attempt+1} for {username}: {str(e)}"
                 )
-                time.sleep(2**attempt)
+                sleep_backoff(attempt)
 
         logger.error(f"All attempts to scrape data for {username} failed.")
         return None
 
-    def _parse_modern_table(self, soup, user_id, username):
+    async def _scrape_user_scores_async(
+        self,
+        session: aiohttp.ClientSession,
+        limiter: AsyncLimiter,
+        username: str,
+        user_id: int,
+    ) -> Optional[List[list]]:
         """
-        Parse modern MyAnimeList table with 'data-items'.
+        Scrape scores for a user without blocking the event loop.
+
+        Mirrors `_scrape_user_scores`, but every request first takes a token
+        from the shared limiter, so users are fetched as fast as the rate
+        budget allows instead of in fixed, sleep-separated batches.
 
         Args:
-            soup (BeautifulSoup): Parsed HTML of the user's animelist.
-            user_id (int): MyAnimeList user ID.
+            session (aiohttp.ClientSession): Shared HTTP session.
+            limiter (AsyncLimiter): Rate limiter shared by all requests.
             username (str): MyAnimeList username.
+            user_id (int): MyAnimeList user ID.
 
         Returns:
-            Optional[List[list]]: Parsed score records or None.
+            Optional[List[list]]: List of [user_id, username, anime_id, anime_title, score] records.
         """
-        logger.debug(f"Attempting to parse modern table for {username}.")
-        if table := soup.find("table", {"data-items": True}):
+        if (cached := self.cache.get((username, user_id))) is not MISSING:
+            return cached
+        logger.debug(f"Starting scraping for user: {username}.")
+        url = f"{MAL_URL}/animelist/{username}?status={self.status_code}"
+        for attempt in range(self.config.max_retries):
             try:
-                data = [
-                    [
-                        user_id,
-                        username,
-                        item["anime_id"],
-                        item["anime_title"],
-                        item["score"],
-                    ]
-                    for item in json.loads(table["data-items"])
-                    if item["score"] > 0
-                ]
-                logger.debug(f"Modern table parsed with {len(data)} records.")
-                return data
-            except json.JSONDecodeError:
-                logger.warning(
-                    f"JSON decoding error in modern table for {username}."
+                async with limiter:
+                    async with session.get(url) as response:
+                        status = response.status
+                        if status == 200:
+                            content = await response.read()
+                            encoding = response.charset
+
+                if status == 200:
+                    logger.debug(
+                        f"Successfully retrieved HTML for {username}."
+                    )
+                    data = self._parse_scores(
+                        content, encoding, user_id, username
+                    )
+                    self.cache.set((username, user_id), data)
+                    return data
+
+                if status == 404:
+                    logger.info(
+                        f"User not found: {username}. Skipping further attempts."
+                    )
+                    self.cache.set((username, user_id), None)
+                    return None
+
+                if is_terminal_status(status):
+                    logger.warning(
+                        f"Request for {username} rejected (HTTP {status}). Skipping further attempts."
+                    )
+                    return None
+
+                if status == 429:
+                    logger.warning(
+                        f"Rate limit exceeded for {username}. Retrying..."
+                    )
+                else:
+                    logger.warning(
+                        f"Attempt {attempt+1} failed for {username} (HTTP {status})."
+                    )
+                await async_sleep_backoff(attempt, response)
+
+            except Exception as e:
+                logger.error(
+                    f"Error on attempt {attempt+1} for {username}: {str(e)}"
                 )
+                await async_sleep_backoff(attempt)
+
+        logger.error(f"All attempts to scrape data for {username} failed.")
         return None
 
-    def _parse_legacy_tables(self, soup, user_id, username):
+    def _parse_scores(
+        self,
+        content: bytes,
+        encoding: Optional[str],
+        user_id: int,
+        username: str,
+    ) -> Optional[List[list]]:
         """
-        Parse legacy MyAnimeList tables (traditional HTML structure).
+        Parse an animelist page in a single pass over its tables.
+
+        The modern 'data-items' table wins when it yields records; otherwise
+        the rows collected from the legacy tables on the same pass are used.
 
         Args:
-            soup (BeautifulSoup): Parsed HTML of the user's animelist.
+            content (bytes): Raw HTML of the user's animelist.
+            encoding (Optional[str]): Charset declared by the server, if any.
             user_id (int): MyAnimeList user ID.
             username (str): MyAnimeList username.
 
         Returns:
             Optional[List[list]]: Parsed score records or None.
         """
-        logger.debug(f"Attempting to parse legacy tables for {username}.")
+        soup = BeautifulSoup(
+            content, "lxml", parse_only=SCORE_TABLES, from_encoding=encoding
+        )
+        modern_seen = False
         scores = []
-        for table in soup.find_all(
-            "table",
-            {
-                "border": "0",
-                "cellpadding": "0",
-                "cellspacing": "0",
-                "width": "100%",
-            },
-        ):
-            for row in table.find_all("tr"):
-                cells = row.find_all("td")
-                if len(cells) >= 5:
-                    anime_data = self._extract_anime_data(cells[1])
-                    score_data = self._extract_score_data(cells[2])
-                    if anime_data and score_data:
-                        scores.append(
-                            [
-                                user_id,
-                                username,
-                                anime_data[0],
-                                anime_data[1],
-                                score_data,
-                            ]
-                        )
+        for table in soup.find_all("table"):
+            if table.has_attr("data-items"):
+                if modern_seen:
+                    continue
+                modern_seen = True
+                if data := self._parse_modern_table(table, user_id, username):
+                    return data
+            elif all(
+                table.get(attr) == value
+                for attr, value in LEGACY_TABLE_ATTRS.items()
+            ):
+                scores.extend(
+                    self._parse_legacy_table(table, user_id, username)
+                )
         logger.debug(f"Legacy tables parsed with {len(scores)} records.")
         return scores if scores else None
 
-    def _extract_anime_data(self, cell):
+    def _parse_modern_table(self, table, user_id, username):
         """
-        Extract anime ID and title from a table cell.
+        Parse modern MyAnimeList table with 'data-items'.
 
         Args:
-            cell (bs4.element.Tag): Table cell containing anime information.
+            table (bs4.element.Tag): Table carrying the 'data-items' JSON.
+            user_id (int): MyAnimeList user ID.
+            username (str): MyAnimeList username.
 
         Returns:
-            Optional[tuple]: (anime_id, anime_title) or None.
+            Optional[List[list]]: Parsed score records or None.
         """
-        if link := cell.find("a", class_="animetitle"):
-            return (link["href"].split("/")[2], link.find("span").text.strip())
+        logger.debug(f"Attempting to parse modern table for {username}.")
+        try:
+            data = [
+                [
+                    user_id,
+                    username,
+                    item["anime_id"],
+                    item["anime_title"],
+                    item["score"],
+                ]
+                for item in orjson.loads(table["data-items"])
+                if item["score"] > 0
+            ]
+            logger.debug(f"Modern table parsed with {len(data)} records.")
+            return data
+        except orjson.JSONDecodeError:
+            logger.warning(
+                f"JSON decoding error in modern table for {username}."
+            )
         return None
 
-    def _extract_score_data(self, cell):
+    def _parse_legacy_table(self, table, user_id, username):
         """
-        Extract the score from a table cell.
+        Parse a legacy MyAnimeList table (traditional HTML structure).
 
         Args:
-            cell (bs4.element.Tag): Table cell containing the score.
+            table (bs4.element.Tag): Legacy list table.
+            user_id (int): MyAnimeList user ID.
+            username (str): MyAnimeList username.
 
         Returns:
-            Optional[int]: Score value or None if unavailable.
+            List[list]: Parsed score records, possibly empty.
         """
-        if score_label := cell.find("span", class_="score-label"):
-            return (
-                int(score_label.text.strip())
-                if score_label.text.strip() != "-"
-                else None
+        scores = []
+        for row in LEGACY_ROWS.select(table):
+            link = ANIME_LINK.select_one(row)
+            label = SCORE_LABEL.select_one(row)
+            if link is None or label is None:
+                continue
+            score = label.text.strip()
+            if score == "-" or not (score := int(score)):
+                continue
+            scores.append(
+                [
+                    user_id,
+                    username,
+                    link["href"].split("/")[2],
+                    link.find("span").text.strip(),
+                    score,
+                ]
             )
-        return None
+        return scores
 
     def get_scores(self, users_buffer: BytesIO) -> BytesIO:
         """
@@ -244,36 +387,59 @@ class ScoreService:
         """
         logger.info("Starting user processing to generate CSV.")
         users_df = pd.read_csv(users_buffer)
-        buffer = StringIO()
-        writer = csv.writer(buffer)
+        buffer = BytesIO()
+        text_buffer = TextIOWrapper(
+            buffer, encoding="utf-8", newline="", write_through=True
+        )
+        writer = csv.writer(text_buffer)
         writer.writerow(
             ["User ID", "Username", "Anime ID", "Anime Title", "Score"]
         )
 
+        asyncio.run(self._write_scores(users_df, writer))
+
+        logger.info("Processing complete. Generating CSV file.")
+        # Detach so the wrapper does not close the buffer when collected
+        text_buffer.detach()
+        buffer.seek(0)
+        return buffer
+
+    async def _write_scores(self, users_df: pd.DataFrame, writer) -> None:
+        """
+        Scrape every user in batches and write their scores as they arrive.
+
+        Batches only bound memory and progress reporting; pacing is left to
+        a token-bucket limiter so there are no idle gaps between batches.
+
+        Args:
+            users_df (pd.DataFrame): Users with 'username' and 'mal_id'.
+            writer: CSV writer receiving the score rows.
+        """
         total_users = len(users_df)
         logger.info(f"Total users to process: {total_users}.")
         processed = 0
 
-        for i in range(0, total_users, self.batch_size):
-            batch = users_df.iloc[i : i + self.batch_size].to_dict("records")
-            logger.info(f"Processing batch {i // self.batch_size + 1}.")
-            batch_data = self._process_batch(batch)
-
-            if batch_data:
-                writer.writerows(batch_data)
-                processed += len(batch)
-                logger.info(
-                    f"Processed: {processed}/{total_users} ({processed/total_users:.1%})."
+        limiter = AsyncLimiter(self.requests_per_minute, 60)
+        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+        connector = aiohttp.TCPConnector(limit=self.config.rate_limit)
+        async with aiohttp.ClientSession(
+            timeout=timeout, connector=connector
+        ) as session:
+            for i in range(0, total_users, self.batch_size):
+                batch = users_df.iloc[i : i + self.batch_size].to_dict(
+                    "records"
+                )
+                logger.info(f"Processing batch {i // self.batch_size + 1}.")
+                batch_data = await self._process_batch(
+                    session, limiter, batch
                 )
 
-            if i + self.batch_size < total_users:
-                delay = random.randint(self.min_delay, self.max_delay)
-                logger.info(f"Waiting {delay}s for the next batch...")
-                time.sleep(delay)
-
-        logger.info("Processing complete. Generating CSV file.")
-        buffer.seek(0)
-        return BytesIO(buffer.getvalue().encode("utf-8"))
+                if batch_data:
+                    writer.writerows(batch_data)
+                    processed += len(batch)
+                    logger.info(
+                        f"Processed: {processed}/{total_users} ({processed/total_users:.1%})."
+                    )
 
     def get_user_anime_score(
         self, username: str, user_id: int, anime_id: int
@@ -1,17 +1,68 @@
-import csv
+import asyncio
 import logging
-import time
-from io import BytesIO, StringIO
-from typing import List, Optional
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import AsyncIterator, Iterator, List, Optional, Sequence
 
-import requests
+import diskcache
+import httpx
+import orjson
+from aiolimiter import AsyncLimiter
 
 from genetic_rule_miner.config import APIConfig
+from genetic_rule_miner.utils.http_client import (
+    MISSING,
+    NotFoundCache,
+    ResponseCache,
+    TokenBucket,
+    async_sleep_backoff,
+    build_async_http2_client,
+    build_http2_client,
+    sleep_backoff,
+)
 from genetic_rule_miner.utils.logging import LogManager
 
+try:
+    # libuv-based loop with cheaper callback dispatch; not on Windows
+    from uvloop import new_event_loop
+except ImportError:
+    from asyncio import new_event_loop
+
 LogManager.configure()
 logger = logging.getLogger(__name__)
 
+USER_FIELDS = ("user_id", "username", "user_url")
+# IDs fetched per gather; bounds memory and sets the progress-log cadence
+FETCH_CHUNK_SIZE = 100
+# Consecutive IDs checked per probe when locating the newest user. Runs of
+# deleted accounts shorter than this are never mistaken for the end of the
+# ID space; misses are cached, so the sweep does not request them again
+MAX_ID_PROBE_WINDOW = 100
+
+# Bytes that force a CSV field to be quoted, as csv.QUOTE_MINIMAL does
+_NEEDS_QUOTING = re.compile(rb'[,"\r\n]')
+_CSV_HEADER = b",".join(f.encode() for f in USER_FIELDS) + b"\n"
+
+
+def _csv_field(value: Optional[str]) -> bytes:
+    """
+    Encode one text field of a CSV line, quoting it only when needed.
+
+    Args:
+        value (Optional[str]): Field value; None is written as empty.
+
+    Returns:
+        bytes: The UTF-8 encoded field.
+    """
+    if not value:
+        return b""
+    raw = value.encode("utf-8")
+    if _NEEDS_QUOTING.search(raw):
+        return b'"' + raw.replace(b'"', b'""') + b'"'
+    return raw
+
 
 class UserService:
     """
@@ -19,6 +70,16 @@ class UserService:
 
     Attributes:
         config (APIConfig): Configuration for API requests, retries, and delays.
+        session (httpx.Client): HTTP/2 client reused across calls, so
+            concurrent requests share one multiplexed connection.
+        limiter (TokenBucket): Caps blocking requests at
+            `config.rate_limit` per second.
+        disk_cache (diskcache.Cache): Responses persisted between runs,
+            keyed by URL. 404s of other endpoints are stored too, so they
+            are not requested again until they expire.
+        not_found (NotFoundCache): User IDs known to be missing, checked in
+            memory before any lookup; the only record of user ID 404s.
+        username_ids (ResponseCache): Memoized username -> user ID lookups.
     """
     def __init__(self, config: APIConfig = APIConfig()):
         """
@@ -29,6 +90,21 @@ class UserService:
                 retry count, and request delay. Defaults to APIConfig().
         """
         self.config = config
+        self._base_url = config.base_url.rstrip("/")
+        self._user_url_prefix = self._base_url + "/users/userbyid/"
+        self.session = build_http2_client(config.timeout)
+        self.limiter = TokenBucket(config.rate_limit)
+        self.disk_cache = diskcache.Cache(
+            directory=os.path.join(config.cache_dir, "jikan_users"),
+            size_limit=500 * 1024 * 1024,
+        )
+        self.not_found = NotFoundCache(
+            os.path.join(config.cache_dir, "user_not_found.pkl"),
+            config.not_found_ttl,
+        )
+        self.username_ids = ResponseCache(
+            config.cache_maxsize, config.cache_ttl
+        )
         logger.info(
             "UserService initialized with configuration: %s", self.config
         )
@@ -37,24 +113,56 @@ class UserService:
         """
         Perform a generic GET request with retries and error handling.
 
+        Once a cached response expires, the request is made conditional on
+        the validators (ETag / Last-Modified) stored with the last payload;
+        a 304 reuses that payload without downloading or parsing it again.
+
         Args:
             endpoint (str): API endpoint to query.
 
         Returns:
             dict: JSON response if successful, otherwise an empty dict.
         """
-        url = f"https://api.jikan.moe/v4{endpoint}"
+        url = self._base_url + endpoint
+        if (cached := self.disk_cache.get(url, MISSING)) is not MISSING:
+            return cached
+        validated = self.disk_cache.get(("validators", url))
+        headers = {}
+        if validated:
+            etag, last_modified, _ = validated
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
         for attempt in range(self.config.max_retries):
             try:
                 logger.debug("Requesting %s (attempt %d)", url, attempt + 1)
-                response = requests.get(url, timeout=self.config.timeout)
+                self.limiter.acquire()
+                response = self.session.get(
+                    url, headers=headers, timeout=self.config.timeout
+                )
+                if response.status_code == 304 and validated:
+                    logger.debug("Not modified: %s", url)
+                    payload = validated[2]
+                    self._cache_response(url, payload)
+                    return payload
                 if response.status_code == 200:
-                    return response.json()
+                    payload = orjson.loads(response.content)
+                    self._cache_response(url, payload)
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        self.disk_cache.set(
+                            ("validators", url),
+                            (etag, last_modified, payload),
+                        )
+                    return payload
                 elif response.status_code == 404:
                     logger.warning("Resource not found: %s", url)
+                    self._cache_response(url, {})
                     return {}
                 response.raise_for_status()
-            except requests.RequestException as e:
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
                 logger.warning(
                     "Error on attempt %d for %s: %s",
                     attempt + 1,
@@ -62,7 +170,7 @@ class UserService:
                     str(e),
                 )
                 if attempt < self.config.max_retries - 1:
-                    time.sleep(2**attempt)
+                    sleep_backoff(attempt, getattr(e, "response", None))
         logger.error(
             "Failed to get resource: %s after %d attempts",
             url,
@@ -70,6 +178,16 @@ class UserService:
         )
         return {}
 
+    def _cache_response(self, url: str, value) -> None:
+        """
+        Persist a definitive API answer for `url`.
+
+        Args:
+            url (str): Requested URL, used as the cache key.
+            value: Parsed payload, or the empty value returned for a 404.
+        """
+        self.disk_cache.set(url, value, expire=self.config.disk_cache_ttl)
+
     def _fetch_with_retry(self, user_id: int) -> Optional[dict]:
         """
         Fetch user data by ID with retry logic and error handling.
@@ -80,27 +198,42 @@ class UserService:
         Returns:
             Optional[dict]: User data if successful, otherwise None.
         """
-        logger.debug("Starting _fetch_with_retry for user_id: %d", user_id)
+        # Resolved once per call so disabled DEBUG costs nothing per attempt
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Starting _fetch_with_retry for user_id: %d", user_id
+            )
+        if user_id in self.not_found:
+            if debug:
+                logger.debug("User ID %d is known to be missing", user_id)
+            return None
+        url = self._user_url_prefix + str(user_id)
+        if (cached := self.disk_cache.get(url, MISSING)) is not MISSING:
+            return cached
         for attempt in range(self.config.max_retries):
             try:
-                logger.debug(
-                    "Attempt %d for user_id: %d", attempt + 1, user_id
-                )
-                response = requests.get(
-                    f"https://api.jikan.moe/v4/users/userbyid/{user_id}",
-                    timeout=self.config.timeout,
-                )
+                if debug:
+                    logger.debug(
+                        "Attempt %d for user_id: %d", attempt + 1, user_id
+                    )
+                self.limiter.acquire()
+                response = self.session.get(url, timeout=self.config.timeout)
 
                 if response.status_code == 200:
-                    logger.info("User ID %d successfully found", user_id)
-                    return response.json().get("data")
+                    if debug:
+                        logger.debug("User ID %d successfully found", user_id)
+                    data = orjson.loads(response.content).get("data")
+                    self._cache_response(url, data)
+                    return data
                 elif response.status_code == 404:
                     logger.warning("User ID %d not found (404)", user_id)
+                    self.not_found.add(user_id)
                     return None
 
                 response.raise_for_status()
 
-            except requests.exceptions.RequestException as e:
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
                 logger.error(
                     "Error on attempt %d for user_id %d: %s",
                     attempt + 1,
@@ -109,7 +242,7 @@ class UserService:
                 )
                 if attempt < self.config.max_retries - 1:
                     logger.debug("Waiting before the next attempt...")
-                    time.sleep(2**attempt)  # Exponential backoff
+                    sleep_backoff(attempt, getattr(e, "response", None))
 
         logger.error(
             "User ID %d unavailable after %d attempts",
@@ -118,74 +251,311 @@ class UserService:
         )
         return None
 
-    def generate_userlist(self, start_id: int, end_id: int) -> BytesIO:
+    async def _fetch_with_retry_async(
+        self,
+        client: httpx.AsyncClient,
+        limiter: AsyncLimiter,
+        user_id: int,
+    ) -> Optional[dict]:
         """
-        Generate a CSV list of users by searching a range of IDs.
+        Fetch user data by ID without blocking the event loop.
+
+        Mirrors `_fetch_with_retry`: a 404 short-circuits and any other
+        failure is retried with backoff. Cache reads and writes touch disk,
+        so they run in the default executor instead of on the event loop.
 
         Args:
-            start_id (int): Starting user ID.
-            end_id (int): Ending user ID.
+            client (httpx.AsyncClient): Shared HTTP/2 client.
+            limiter (AsyncLimiter): Rate limiter shared by all requests.
+            user_id (int): The MyAnimeList user ID to fetch.
 
         Returns:
-            BytesIO: CSV data containing user_id, username, and user_url.
+            Optional[dict]: User data if successful, otherwise None.
         """
-        logger.info(
-            "Starting user list generation for IDs %d to %d",
-            start_id,
-            end_id,
-        )
-        text_buffer = StringIO()
-        writer = csv.DictWriter(
-            text_buffer,
-            fieldnames=["user_id", "username", "user_url"],
-            extrasaction="ignore",
+        # Resolved once per call so disabled DEBUG costs nothing per attempt
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Starting _fetch_with_retry for user_id: %d", user_id
+            )
+        if user_id in self.not_found:
+            if debug:
+                logger.debug("User ID %d is known to be missing", user_id)
+            return None
+        url = self._user_url_prefix + str(user_id)
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(
+            None, self.disk_cache.get, url, MISSING
         )
-        writer.writeheader()
-
-        valid_users = 0
-        total_processed = 0
-
-        for user_id in range(start_id, end_id + 1):
+        if cached is not MISSING:
+            return cached
+        for attempt in range(self.config.max_retries):
             try:
-                logger.debug("Processing user_id: %d", user_id)
-                data = self._fetch_with_retry(user_id)
-                user_record = {
-                    "user_id": user_id,
-                    "username": data.get("username") if data else None,
-                    "user_url": data.get("url") if data else None,
-                }
-
-                if data:
-                    writer.writerow(user_record)
-                    valid_users += 1
-                    logger.info("User ID %d added to the list", user_id)
-                else:
-                    logger.warning("User ID %d has no valid data", user_id)
-
-                time.sleep(self.config.request_delay)
-
-            except Exception as e:
+                if debug:
+                    logger.debug(
+                        "Attempt %d for user_id: %d", attempt + 1, user_id
+                    )
+                async with limiter:
+                    response = await client.get(url)
+                if response.status_code == 404:
+                    logger.warning("User ID %d not found (404)", user_id)
+                    # May pickle the set to disk every flush_every additions
+                    await loop.run_in_executor(
+                        None, self.not_found.add, user_id
+                    )
+                    return None
+                response.raise_for_status()
+                payload = orjson.loads(response.content)
+                if debug:
+                    logger.debug("User ID %d successfully found", user_id)
+                data = payload.get("data")
+                await loop.run_in_executor(
+                    None, self._cache_response, url, data
+                )
+                return data
+
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
                 logger.error(
-                    "Critical error processing ID %d: %s", user_id, str(e)
+                    "Error on attempt %d for user_id %d: %s",
+                    attempt + 1,
+                    user_id,
+                    str(e),
                 )
-            finally:
-                total_processed += 1
-                if total_processed % 100 == 0:
-                    logger.info(
-                        "Progress: %.1f%% (%d/%d)",
-                        total_processed / (end_id - start_id + 1) * 100,
-                        total_processed,
-                        end_id - start_id + 1,
+                if attempt < self.config.max_retries - 1:
+                    logger.debug("Waiting before the next attempt...")
+                    await async_sleep_backoff(
+                        attempt, getattr(e, "response", None)
                     )
 
-        # Convert to bytes before returning
-        text_buffer.seek(0)
-        byte_buffer = BytesIO(text_buffer.getvalue().encode("utf-8"))
+        logger.error(
+            "User ID %d unavailable after %d attempts",
+            user_id,
+            self.config.max_retries,
+        )
+        return None
+
+    def _has_user_near(self, user_id: int, end_id: int) -> bool:
+        """
+        Check whether any user exists in a short window starting at an ID.
+
+        Args:
+            user_id (int): First ID of the window.
+            end_id (int): Last ID the window may reach.
+
+        Returns:
+            bool: True if at least one ID in the window resolves to a user.
+        """
+        stop = min(user_id + MAX_ID_PROBE_WINDOW, end_id + 1)
+        return any(self._fetch_with_retry(i) for i in range(user_id, stop))
+
+    def _find_max_id(self, start_id: int, end_id: int) -> int:
+        """
+        Find the newest user ID within a range.
+
+        User IDs are assigned incrementally, so when the tail of the range is
+        empty the search gallops down from `end_id` in doubling steps until a
+        probe finds a user, then bisects between that hit and the last miss.
+        The result is never below a confirmed hit, and if no probe finds a
+        user the range is left unclamped. Probed users and misses land in the
+        response caches, so the sweep does not request them again.
+
+        Args:
+            start_id (int): Starting user ID, not above `end_id`.
+            end_id (int): Ending user ID.
+
+        Returns:
+            int: Highest ID worth scanning, never above `end_id`.
+        """
+        miss = max(start_id, end_id - MAX_ID_PROBE_WINDOW + 1)
+        if self._has_user_near(miss, end_id):
+            return end_id
+
+        step = MAX_ID_PROBE_WINDOW
+        while True:
+            if miss == start_id:
+                # Nothing found anywhere: scan the whole range to be safe
+                return end_id
+            hit = max(start_id, miss - step)
+            if self._has_user_near(hit, end_id):
+                break
+            miss = hit
+            step *= 2
+
+        while miss - hit > 1:
+            mid = (hit + miss) // 2
+            if self._has_user_near(mid, end_id):
+                hit = mid
+            else:
+                miss = mid
+        return min(hit + MAX_ID_PROBE_WINDOW - 1, end_id)
+
+    async def _iter_fetched(
+        self, user_ids: Sequence[int]
+    ) -> AsyncIterator[tuple[Sequence[int], list]]:
+        """
+        Fetch users concurrently under the API rate limit, chunk by chunk.
+
+        One HTTP/2 client, semaphore and token bucket serve the whole sweep;
+        in-flight requests are multiplexed over a single connection when the
+        server supports it. The semaphore caps in-flight requests while the
+        token bucket spaces them to `config.rate_limit` per second, so
+        request latency counts towards the budget instead of adding to it.
+
+        Args:
+            user_ids (Sequence[int]): MyAnimeList user IDs to fetch.
+
+        Yields:
+            tuple[Sequence[int], list]: A chunk of IDs and their user data in
+                the same order; an exception instance marks an ID whose
+                fetch crashed.
+        """
+        semaphore = asyncio.Semaphore(self.config.rate_limit)
+        limiter = AsyncLimiter(self.config.rate_limit, 1)
+        total = len(user_ids)
+        percent_per_id = 100.0 / total if total else 0.0
+
+        async with build_async_http2_client(
+            self.config.timeout, max_connections=self.config.rate_limit
+        ) as client:
+
+            async def bounded(user_id: int) -> Optional[dict]:
+                async with semaphore:
+                    return await self._fetch_with_retry_async(
+                        client, limiter, user_id
+                    )
+
+            for i in range(0, total, FETCH_CHUNK_SIZE):
+                chunk = user_ids[i : i + FETCH_CHUNK_SIZE]
+                results = await asyncio.gather(
+                    *(bounded(u) for u in chunk), return_exceptions=True
+                )
+                done = i + len(chunk)
+                logger.info(
+                    "Progress: %.1f%% (%d/%d)",
+                    done * percent_per_id,
+                    done,
+                    total,
+                )
+                yield chunk, results
+
+    def _iter_csv(self, user_ids: Sequence[int]) -> Iterator[bytes]:
+        """
+        Fetch users and yield their CSV lines as UTF-8 bytes.
+
+        Fetching runs on a private event loop (uvloop when installed) that
+        is resumed chunk by chunk, so rows reach the caller while later IDs
+        are still pending and memory stays bounded by one chunk.
+
+        Lines are formatted directly as bytes rather than through
+        `csv.writer`, quoting only fields that contain a delimiter, quote or
+        line break.
+
+        Args:
+            user_ids (Sequence[int]): MyAnimeList user IDs to fetch.
+
+        Yields:
+            bytes: The header line, then one line per user found, in ID
+                order.
+        """
+        yield _CSV_HEADER
+
+        valid_users = 0
+        loop = new_event_loop()
+        fetched = self._iter_fetched(user_ids)
+        try:
+            while True:
+                try:
+                    chunk, results = loop.run_until_complete(
+                        fetched.__anext__()
+                    )
+                except StopAsyncIteration:
+                    break
+                for user_id, data in zip(chunk, results):
+                    if isinstance(data, Exception):
+                        logger.error(
+                            "Critical error processing ID %d: %s",
+                            user_id,
+                            str(data),
+                        )
+                    elif data:
+                        valid_users += 1
+                        logger.debug("User ID %d added to the list", user_id)
+                        yield b"%d,%s,%s\n" % (
+                            user_id,
+                            _csv_field(data.get("username")),
+                            _csv_field(data.get("url")),
+                        )
+                    else:
+                        logger.warning("User ID %d has no valid data", user_id)
+        finally:
+            loop.run_until_complete(fetched.aclose())
+            loop.close()
+            self.not_found.flush()
         logger.info(
             "Generation completed. Valid users: %d/%d",
             valid_users,
-            total_processed,
+            len(user_ids),
         )
+
+    def iter_userlist_csv(self, start_id: int, end_id: int) -> Iterator[bytes]:
+        """
+        Stream a CSV list of users by searching a range of IDs.
+
+        The range is first clamped to the newest existing user (see
+        `_find_max_id`), so IDs that have not been assigned yet are skipped.
+        Nothing is requested until the first line is consumed.
+
+        Args:
+            start_id (int): Starting user ID.
+            end_id (int): Ending user ID.
+
+        Yields:
+            bytes: CSV lines (header first) with user_id, username, and
+                user_url, ready to be written to a file or response.
+        """
+        if start_id > end_id:
+            logger.info("Empty ID range %d to %d", start_id, end_id)
+            yield from self._iter_csv(())
+            return
+        max_id = self._find_max_id(start_id, end_id)
+        if max_id < end_id:
+            logger.info("No users past ID %d, narrowing the scan", max_id)
+        logger.info(
+            "Starting user list generation for IDs %d to %d",
+            start_id,
+            max_id,
+        )
+        yield from self._iter_csv(range(start_id, max_id + 1))
+
+    def iter_users_csv(self, user_ids: List[int]) -> Iterator[bytes]:
+        """
+        Stream multiple users as CSV lines.
+
+        Args:
+            user_ids (List[int]): List of MyAnimeList user IDs.
+
+        Yields:
+            bytes: CSV lines (header first) with user_id, username, and
+                user_url.
+        """
+        logger.info("Starting user retrieval for IDs: %s", user_ids)
+        yield from self._iter_csv(user_ids)
+
+    def generate_userlist(self, start_id: int, end_id: int) -> BytesIO:
+        """
+        Generate a CSV list of users by searching a range of IDs.
+
+        Args:
+            start_id (int): Starting user ID.
+            end_id (int): Ending user ID.
+
+        Returns:
+            BytesIO: CSV data containing user_id, username, and user_url.
+        """
+        byte_buffer = BytesIO()
+        for line in self.iter_userlist_csv(start_id, end_id):
+            byte_buffer.write(line)
+        byte_buffer.seek(0)
         return byte_buffer
 
     def get_users(self, user_ids: List[int]) -> BytesIO:
@@ -198,30 +568,10 @@ class UserService:
         Returns:
             BytesIO: CSV data containing user_id, username, and user_url.
         """
-        logger.info("Starting user retrieval for IDs: %s", user_ids)
-        text_buffer = StringIO()
-        writer = csv.DictWriter(
-            text_buffer, fieldnames=["user_id", "username", "user_url"]
-        )
-        writer.writeheader()
-
-        for user_id in user_ids:
-            logger.debug("Processing user_id: %d", user_id)
-            data = self._fetch_with_retry(user_id)
-            if data:
-                record = {
-                    "user_id": user_id,
-                    "username": data.get("username"),
-                    "user_url": data.get("url"),
-                }
-                writer.writerow(record)
-                logger.info("User ID %d added to the file", user_id)
-                time.sleep(self.config.request_delay)
-            else:
-                logger.warning("User ID %d has no valid data", user_id)
-
-        text_buffer.seek(0)
-        byte_buffer = BytesIO(text_buffer.getvalue().encode("utf-8"))
+        byte_buffer = BytesIO()
+        for line in self.iter_users_csv(user_ids):
+            byte_buffer.write(line)
+        byte_buffer.seek(0)
         logger.info("User retrieval completed")
         return byte_buffer
 
@@ -241,61 +591,55 @@ class UserService:
         """
         Fetch multiple users by their IDs.
 
+        Requests run on `config.rate_limit` worker threads; the shared
+        session and token bucket are thread-safe and keep the overall rate
+        within the API limit.
+
         Args:
             user_ids (List[int]): List of user IDs.
 
         Returns:
             list: List of user data dictionaries (or None for missing users).
         """
-        return [self._fetch_with_retry(uid) for uid in user_ids]
+        with ThreadPoolExecutor(max_workers=self.config.rate_limit) as ex:
+            return list(ex.map(self._fetch_with_retry, user_ids))
 
     def get_user_id_from_username(self, username: str) -> Optional[int]:
         """
         Fetch the MyAnimeList user ID for a given username.
 
+        Resolved IDs and unknown usernames (404) are memoized, so repeated
+        lookups of the same user skip the network.
+
         Args:
             username (str): The MyAnimeList username.
 
         Returns:
             Optional[int]: User ID if found, otherwise None.
         """
+        if (cached := self.username_ids.get(username)) is not MISSING:
+            return cached
         try:
-            response = requests.get(
-                f"https://api.jikan.moe/v4/users/{username}", timeout=10
+            self.limiter.acquire()
+            response = self.session.get(
+                self._base_url + "/users/" + username,
+                timeout=self.config.timeout,
             )
             if response.status_code == 200:
-                return response.json()["data"]["mal_id"]
-            else:
-                logger.warning(
-                    "No se pudo obtener el ID para el usuario %s", username
-                )
+                user_id = orjson.loads(response.content)["data"]["mal_id"]
+                self.username_ids.set(username, user_id)
+                return user_id
+            if response.status_code == 404:
+                self.username_ids.set(username, None)
+            logger.warning(
+                "No se pudo obtener el ID para el usuario %s", username
+            )
         except Exception as e:
             logger.error("Error obteniendo el ID de %s: %s", username, str(e))
         return None
 
-    def get_user_id_by_username(self, username: str) -> Optional[int]:
-        """
-        Fetch the MyAnimeList user ID by username (alias method).
-
-        Args:
-            username (str): The MyAnimeList username.
-
-        Returns:
-            Optional[int]: User ID if found, otherwise None.
-        """
-        try:
-            response = requests.get(
-                f"https://api.jikan.moe/v4/users/{username}", timeout=10
-            )
-            if response.status_code == 200:
-                return response.json()["data"]["mal_id"]
-            else:
-                logger.warning("No se pudo obtener el usuario %s", username)
-        except Exception as e:
-            logger.error(
-                "Error obteniendo el usuario %s: %s", username, str(e)
-            )
-        return None
+    # Alias kept for existing callers
+    get_user_id_by_username = get_user_id_from_username
 
     def get_user_favorites(self, username: str) -> dict:
         """
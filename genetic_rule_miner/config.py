@@ -3,7 +3,7 @@ import os
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class APIConfig:
     """
     Configuration parameters for external API services.
@@ -12,23 +12,40 @@ class APIConfig:
         base_url (str): Base URL of the API.
         max_retries (int): Maximum number of retry attempts for failed requests.
         timeout (float): Timeout in seconds for API requests.
-        request_delay (float): Delay between consecutive requests in seconds.
-        rate_limit (int): Maximum number of requests allowed per unit time.
+        rate_limit (int): Maximum number of requests allowed per second.
+        cache_maxsize (int): Maximum number of API results kept in memory.
+        cache_ttl (float): Seconds an in-memory API result stays valid.
+        cache_dir (str): Directory for caches persisted between runs.
+        not_found_ttl (float): Seconds an ID reported as missing is skipped.
+        disk_cache_ttl (float): Seconds an API response cached on disk
+            stays valid.
     """
+
     base_url: str = "https://api.jikan.moe/v4/"
     max_retries: int = 3
     timeout: float = 10.0
-    request_delay: float = 0.35
     rate_limit: int = 3
+    cache_maxsize: int = 100_000
+    cache_ttl: float = 3600.0
+    cache_dir: str = os.getenv("API_CACHE_DIR", "./.cache")
+    not_found_ttl: float = 30 * 24 * 3600.0
+    disk_cache_ttl: float = 7 * 24 * 3600.0
 
     def __post_init__(self) -> None:
-        """Validate configuration values to ensure time settings are non-negative."""
-        """Validate configuration values."""
-        if any(val < 0 for val in (self.timeout, self.request_delay)):
+        """Validate that all time settings are non-negative."""
+        if any(
+            val < 0
+            for val in (
+                self.timeout,
+                self.cache_ttl,
+                self.not_found_ttl,
+                self.disk_cache_ttl,
+            )
+        ):
             raise ValueError("Negative values not allowed for time settings")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DBConfig:
     """
     Configuration parameters for database connections.
@@ -39,6 +56,12 @@ class DBConfig:
         database (str): Name of the database.
         user (str): Database username.
         password (str): Database password.
+        pool_size (int): Connections kept open in the engine pool.
+        max_overflow (int): Extra connections allowed above `pool_size`.
+        pool_recycle (int): Seconds after which a pooled connection is
+            replaced.
+        insert_page_size (int): Rows per multi-row INSERT when executing
+            many parameter sets.
     """
 
     host: str = os.getenv("DB_HOST", "postgres")
@@ -46,8 +69,14 @@ class DBConfig:
     database: str = os.getenv("DB_NAME", "mydatabase")
     user: str = os.getenv("DB_USER", "postgres")
     password: str = os.getenv("DB_PASS", "postgres")
+    pool_size: int = int(os.getenv("DB_POOL_SIZE", 16))
+    max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", 32))
+    pool_recycle: int = 3600
+    insert_page_size: int = 10_000
 
     def __post_init__(self) -> None:
-        """Validate that the port number is within the valid TCP range."""
+        """Validate the port range and the pool settings."""
         if self.port <= 0 or self.port > 65535:
             raise ValueError("Invalid port number")
+        if self.pool_size <= 0 or self.max_overflow < 0:
+            raise ValueError("Invalid connection pool size")
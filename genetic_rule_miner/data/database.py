@@ -1,14 +1,20 @@
 import ast
 import csv
-import uuid
+import math
+import os
+import struct
+import threading
 from collections import namedtuple
 from contextlib import contextmanager
+from functools import lru_cache
 from io import BytesIO, StringIO
-from typing import Generator, Optional
+from itertools import groupby
+from operator import itemgetter
+from typing import Callable, Generator, Optional
 
 import numpy as np
-from sqlalchemy import Connection, bindparam, create_engine, text
-from sqlalchemy.dialects.postgresql import JSONB
+import orjson
+from sqlalchemy import Connection, TextClause, create_engine, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import IntegrityError
 
@@ -22,6 +28,323 @@ logger = LogManager.get_logger(__name__)
 
 RuleWithID = namedtuple("RuleWithID", ["rule_id", "rule_obj"])
 
+# Rule batches with at least this many conditions are loaded with COPY;
+# smaller ones go in a single INSERT expanded server-side from JSON
+RULES_COPY_THRESHOLD = 5000
+
+# Rows fetched per round trip when streaming rules from a server-side cursor
+STREAM_BATCH_SIZE = 1000
+
+# Key columns checked for conflicts when loading each table
+_CONFLICT_COLS = {
+    "user_score": ("user_id", "anime_id"),
+    "anime_dataset": ("anime_id",),
+    "user_details": ("mal_id",),
+}
+
+# Binary COPY framing: signature, flags and header extension length
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_COPY_TRAILER = struct.pack(">h", -1)
+_NULL_FIELD = struct.pack(">i", -1)
+_TEXT_OID = 25
+_INT16 = struct.Struct(">h")
+_INT32 = struct.Struct(">i")
+# One-dimensional array header: ndim, has-nulls flag, element type OID,
+# length and lower bound
+_ARRAY_HEADER = struct.Struct(">iiiii")
+_EMPTY_TEXT_ARRAY = struct.pack(">iiii", 12, 0, 0, _TEXT_OID)
+
+# Fixed-width column types sent in binary: length-prefixed struct and parser
+_FIXED_WIDTH_TYPES = {
+    "int2": (struct.Struct(">ih"), int),
+    "int4": (struct.Struct(">ii"), int),
+    "int8": (struct.Struct(">iq"), int),
+    "float4": (struct.Struct(">if"), float),
+    "float8": (struct.Struct(">id"), float),
+}
+_TEXT_TYPES = {"text", "varchar", "bpchar"}
+
+
+def _pack_text(value: str) -> bytes:
+    """Encode a text field for binary COPY."""
+    data = value.encode("utf-8")
+    return _INT32.pack(len(data)) + data
+
+
+def _pack_text_array(value: str) -> bytes:
+    """
+    Encode a list literal as a one-dimensional text[] field.
+
+    JSON arrays are parsed directly; Python list literals (single-quoted
+    strings) fall back to `ast.literal_eval`. An empty or blank cell is an
+    empty array; any other value that is neither becomes a single-element
+    array.
+
+    Args:
+        value (str): CSV cell such as '["Action", "Drama"]'.
+
+    Returns:
+        bytes: The field, length prefix included, for binary COPY.
+    """
+    if not value.strip():
+        return _EMPTY_TEXT_ARRAY
+    try:
+        items = orjson.loads(value)
+    except orjson.JSONDecodeError:
+        try:
+            items = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            items = [value]
+    if not isinstance(items, list):
+        items = [value]
+    if not items:
+        return _EMPTY_TEXT_ARRAY
+
+    # Filled in with the field length once every element is encoded
+    parts = [b"", _ARRAY_HEADER.pack(1, 0, _TEXT_OID, len(items), 1)]
+    size = _ARRAY_HEADER.size
+    pack_length = _INT32.pack
+    for item in items:
+        data = str(item).encode("utf-8")
+        parts.append(pack_length(len(data)))
+        parts.append(data)
+        size += 4 + len(data)
+    parts[0] = pack_length(size)
+    return b"".join(parts)
+
+
+def _binary_encoder(typname: str) -> Optional[Callable[[str], bytes]]:
+    """
+    Pick the binary COPY encoder for a column type.
+
+    Args:
+        typname (str): Name of the column type in pg_type.
+
+    Returns:
+        Optional[Callable[[str], bytes]]: Encoder from the CSV text of a
+            value, or None if the type is staged as text and cast on insert.
+    """
+    if typname in _FIXED_WIDTH_TYPES:
+        packer, parse = _FIXED_WIDTH_TYPES[typname]
+        width = packer.size - 4
+        return lambda value: packer.pack(width, parse(value))
+    if typname in _TEXT_TYPES:
+        return _pack_text
+    if typname == "_text":
+        return _pack_text_array
+    return None
+
+
+@lru_cache(maxsize=64)
+def _construct_sql(
+    table: str,
+    source: str,
+    columns: tuple[str, ...],
+    conflict_columns: tuple[str, ...],
+    conflict_action: str,
+    update_clause: Optional[str] = None,
+    casts: tuple[tuple[str, str], ...] = (),
+) -> TextClause:
+    """
+    Construct SQL moving staged rows into a table with optional conflict handling.
+
+    When conflict columns are given only one staged row per key is kept,
+    since a single INSERT cannot touch the same row twice: the last one
+    for DO UPDATE and the first one for DO NOTHING, the row a row-by-row
+    load would have left in the table.
+
+    Statements are cached by their arguments, so repeated loads into the
+    same table reuse the built `text()` clause.
+
+    Args:
+        table (str): Table name.
+        source (str): Table the rows are selected from.
+        columns (tuple[str, ...]): Column names.
+        conflict_columns (tuple[str, ...]): Columns to check for conflict.
+        conflict_action (str): Action to take on conflict ("DO UPDATE", "DO NOTHING").
+        update_clause (str, optional): Custom update clause for conflicts.
+        casts (tuple[tuple[str, str], ...], optional): (column, SQL type)
+            pairs for staged columns that must be cast.
+
+    Returns:
+        TextClause: SQL statement, ready to execute.
+    """
+    column_list = ", ".join(columns)
+    cast_types = dict(casts)
+    select_list = ", ".join(
+        f"CAST({col} AS {cast_types[col]})" if col in cast_types else col
+        for col in columns
+    )
+
+    if conflict_columns:
+        conflict_list = ", ".join(conflict_columns)
+        # ctid follows COPY order in the fresh staging table
+        ctid_order = "DESC" if conflict_action == "DO UPDATE" else "ASC"
+        select = f"""
+            SELECT DISTINCT ON ({conflict_list}) {select_list}
+            FROM {source}
+            ORDER BY {conflict_list}, ctid {ctid_order}
+        """
+        conflict_str = f"ON CONFLICT ({conflict_list})"
+        if conflict_action == "DO UPDATE":
+            update_clause = update_clause or ", ".join(
+                [
+                    f"{col} = EXCLUDED.{col}"
+                    for col in columns
+                    if col not in conflict_columns
+                ]
+            )
+            sql = f"""
+                INSERT INTO {table} ({column_list})
+                {select}
+                {conflict_str} DO UPDATE SET {update_clause}
+            """
+        else:
+            sql = f"""
+                INSERT INTO {table} ({column_list})
+                {select}
+                {conflict_str} {conflict_action}
+            """
+    else:
+        sql = f"""
+            INSERT INTO {table} ({column_list})
+            SELECT {select_list} FROM {source}
+        """
+    return text(sql)
+
+
+
+_RULE_CONDITION_COLUMNS = (
+    "condition_id",
+    "rule_id",
+    "table_name",
+    "column_name",
+    "operator",
+    "value_text",
+    "value_numeric",
+)
+
+
+# Postgres spelling of the non-finite values NUMERIC accepts; JSON has no
+# literal for them and orjson would write null, which the value CHECK rejects
+_NON_FINITE_NUMERIC = {math.inf: "Infinity", -math.inf: "-Infinity"}
+
+
+def _numeric_value(value: int | float) -> int | float | str:
+    """
+    Normalise a condition threshold for value_numeric.
+
+    Finite numbers pass through. NaN and infinities become their NUMERIC
+    text form, which both the JSON and the COPY path load unchanged.
+
+    Args:
+        value (int | float): Numeric threshold of a condition.
+
+    Returns:
+        int | float | str: Value to store in value_numeric.
+    """
+    if not isinstance(value, float) or math.isfinite(value):
+        return value
+    if math.isnan(value):
+        return "NaN"
+    return _NON_FINITE_NUMERIC[value]
+
+
+def _records_json(columns: tuple[str, ...], rows: list[tuple]) -> str:
+    """
+    Serialize rows as a JSON array of objects for json_populate_recordset.
+
+    Args:
+        columns (tuple[str, ...]): Column names, in row order.
+        rows (list[tuple]): Rows to serialize.
+
+    Returns:
+        str: JSON text of the records.
+    """
+    return orjson.dumps(
+        [dict(zip(columns, row)) for row in rows],
+        option=orjson.OPT_SERIALIZE_NUMPY,
+    ).decode()
+
+
+@lru_cache(maxsize=8)
+def _insert_rules_sql(table: str) -> TextClause:
+    """
+    Build the INSERT that loads rules and conditions from JSON arrays.
+
+    Args:
+        table (str): Table that receives the rules.
+
+    Returns:
+        TextClause: Statement taking `:rules` and `:conditions` JSON text.
+    """
+    return text(
+        f"""
+        WITH new_rules AS (
+            INSERT INTO {table}
+            SELECT * FROM json_populate_recordset(
+                NULL::{table}, CAST(:rules AS json)
+            )
+        )
+        INSERT INTO rule_conditions
+        SELECT * FROM json_populate_recordset(
+            NULL::rule_conditions, CAST(:conditions AS json)
+        )
+        """
+    )
+
+
+# Fixed statements, built once instead of re-parsing their binds per call
+_SELECT_COLUMN_TYPES = text(
+    """
+    SELECT a.attname, t.typname,
+           format_type(a.atttypid, a.atttypmod)
+    FROM pg_attribute a
+    JOIN pg_type t ON t.oid = a.atttypid
+    WHERE a.attrelid = CAST(:table AS regclass)
+      AND a.attnum > 0
+      AND NOT a.attisdropped
+    """
+)
+
+_SELECT_TARGETS_WITH_FEW_RULES = text(
+    """
+    SELECT target_value
+    FROM rules
+    GROUP BY target_value
+    HAVING COUNT(*) <= 250
+    """
+)
+
+_SELECT_RULES_BY_TARGET = text(
+    """
+    SELECT
+        r.rule_id,
+        rc.table_name,
+        rc.column_name,
+        rc.operator,
+        rc.value_numeric,
+        rc.value_text
+    FROM (
+        SELECT rule_id, target_value
+        FROM rules
+        WHERE target_value = :target_value
+        AND (
+            CAST(:last_rule_id AS uuid) IS NULL
+            OR rule_id > CAST(:last_rule_id AS uuid)
+        )
+        ORDER BY rule_id
+        LIMIT :limit
+    ) r
+    LEFT JOIN rule_conditions rc ON r.rule_id = rc.rule_id
+    ORDER BY r.rule_id, rc.condition_id
+    """
+)
+
+_SELECT_RULES_SERIES = text(
+    "SELECT * FROM get_rules_series(CAST(:input_json AS jsonb))"
+)
+
 
 class DatabaseManager:
     """
@@ -32,6 +355,7 @@ class DatabaseManager:
         _engine (Engine, optional): SQLAlchemy engine instance.
     """
     _instance = None
+    _lock = threading.Lock()
 
     _engine: Optional[Engine] = None
 
@@ -41,6 +365,9 @@ class DatabaseManager:
         """
         Implement singleton pattern.
 
+        Creation is guarded by a lock so concurrent threads share one
+        instance.
+
         Args:
             config (DBConfig, optional): Configuration for database connection.
 
@@ -48,8 +375,11 @@ class DatabaseManager:
             DatabaseManager: Single instance of the class.
         """
         if cls._instance is None:
-            cls._instance = super(DatabaseManager, cls).__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(DatabaseManager, cls).__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
     def __init__(self, config: Optional[DBConfig] = DBConfig()) -> None:
@@ -61,11 +391,14 @@ class DatabaseManager:
         """
         if self._initialized:
             return
-        self.config = config
-        self._engine = None
-        self._session_factory = None
-        self.initialize()
-        self._initialized = True
+        with self._lock:
+            if self._initialized:
+                return
+            self.config = config
+            self._engine = None
+            self._session_factory = None
+            self.initialize()
+            self._initialized = True
 
     def __del__(self) -> None:
         if self._engine:
@@ -116,7 +449,17 @@ class DatabaseManager:
                     f"postgresql+psycopg2://{self.config.user}:{self.config.password}"
                     f"@{self.config.host}:{self.config.port}/{self.config.database}"
                 )
-                self._engine = create_engine(conn_str)
+                # executemany falls back to multi-row INSERT ... VALUES
+                # pages where COPY does not apply
+                self._engine = create_engine(
+                    conn_str,
+                    pool_size=self.config.pool_size,
+                    max_overflow=self.config.max_overflow,
+                    pool_recycle=self.config.pool_recycle,
+                    pool_pre_ping=False,
+                    executemany_mode="values_plus_batch",
+                    insertmanyvalues_page_size=self.config.insert_page_size,
+                )
                 logger.info("SQLAlchemy engine initialized")
             else:
                 logger.error("Config is empty")
@@ -128,57 +471,6 @@ class DatabaseManager:
                 "SQLAlchemy engine initialization failed"
             ) from e
 
-    def _construct_sql(
-        self,
-        table,
-        columns,
-        conflict_columns,
-        conflict_action,
-        update_clause=None,
-    ) -> str:
-        """
-        Construct SQL insert statement with optional conflict handling.
-
-        Args:
-            table (str): Table name.
-            columns (list[str]): Column names.
-            conflict_columns (list[str]): Columns to check for conflict.
-            conflict_action (str): Action to take on conflict ("DO UPDATE", "DO NOTHING").
-            update_clause (str, optional): Custom update clause for conflicts.
-
-        Returns:
-            str: SQL statement.
-        """
-        placeholders = ", ".join([f":{col}" for col in columns])
-
-        if conflict_columns:
-            conflict_str = f"ON CONFLICT ({', '.join(conflict_columns)})"
-            if conflict_action == "DO UPDATE":
-                update_clause = update_clause or ", ".join(
-                    [
-                        f"{col} = EXCLUDED.{col}"
-                        for col in columns
-                        if col not in conflict_columns
-                    ]
-                )
-                sql = f"""
-                    INSERT INTO {table} ({', '.join(columns)})
-                    VALUES ({placeholders})
-                    {conflict_str} DO UPDATE SET {update_clause}
-                """
-            else:
-                sql = f"""
-                    INSERT INTO {table} ({', '.join(columns)})
-                    VALUES ({placeholders})
-                    {conflict_str} {conflict_action}
-                """
-        else:
-            sql = f"""
-                INSERT INTO {table} ({', '.join(columns)})
-                VALUES ({placeholders})
-            """
-        return sql
-
     def copy_from_buffer(
         self,
         conn: Connection,
@@ -189,62 +481,97 @@ class DatabaseManager:
         """
         Bulk insert data from a CSV buffer into a PostgreSQL table.
 
+        The rows are encoded in PostgreSQL's binary COPY format and streamed
+        into a temporary staging table, then merged into `table` with a
+        single INSERT ... SELECT, so conflicts are still resolved with
+        `conflict_action`. Integer, float and text columns are sent in their
+        binary form and array columns holding JSON or Python list literals
+        as text[]; any other type (e.g. NUMERIC) is staged as text and cast
+        on insert.
+
         Args:
             conn (Connection): Active database connection.
-            buffer (StringIO): CSV data buffer.
+            buffer (StringIO): CSV data buffer with a header row; `\\N`
+                marks NULL values.
             table (str): Target table name.
             conflict_action (str): Conflict handling strategy.
 
         Returns:
             bool: True if data loaded, False otherwise.
         """
-        def to_pg_array(arr):
-            def escape_element(el):
-                el = str(el).replace("\\", "\\\\").replace('"', '\\"')
-                if any(c in el for c in [",", " ", "{", "}", '"']):
-                    return f'"{el}"'
-                return el
-
-            return "{" + ",".join(escape_element(e) for e in arr) + "}"
-
         buffer.seek(0)
-        reader = csv.DictReader(buffer)
-        columns = reader.fieldnames
-        table_conflict_columns = self._get_conflict_columns(table)
-
-        array_columns = [
-            "genres",
-            "keywords",
-            "producers",
-        ]
+        reader = csv.reader(buffer)
+        columns = next(reader, None)
+        if not columns:
+            logger.info("No data loaded (empty or all rows skipped)")
+            return False
 
-        rows_to_insert = []
+        column_types = self._get_column_types(conn, table)
+        unknown = [col for col in columns if col not in column_types]
+        if unknown:
+            raise DatabaseError(f"Unknown columns for {table}: {unknown}")
+
+        encoders = []
+        staging_columns = []
+        casts = {}
+        for col in columns:
+            typname, sql_type = column_types[col]
+            encoder = _binary_encoder(typname)
+            if encoder is None:
+                encoder = _pack_text
+                casts[col] = sql_type
+                sql_type = "text"
+            encoders.append(encoder)
+            staging_columns.append(f"{col} {sql_type}")
+
+        payload = BytesIO()
+        write = payload.write
+        pack_count = _INT16.pack
+        write(_COPY_HEADER)
+        rows = 0
         for row in reader:
-            cleaned_row = {
-                key: None if value == "\\N" else value
-                for key, value in row.items()
-            }
-            for col in array_columns:
-                if col in cleaned_row and cleaned_row[col]:
-                    try:
-                        value = cleaned_row[col]
-                        if isinstance(value, str):
-                            lst = ast.literal_eval(value)
-                            if isinstance(lst, list):
-                                cleaned_row[col] = to_pg_array(lst)
-                    except Exception:
-                        pass
-            rows_to_insert.append(cleaned_row)
-
-        if not rows_to_insert:
+            write(pack_count(len(row)))
+            write(
+                b"".join(
+                    [
+                        _NULL_FIELD if value == "\\N" else encode(value)
+                        for encode, value in zip(encoders, row)
+                    ]
+                )
+            )
+            rows += 1
+        if not rows:
             logger.info("No data loaded (empty or all rows skipped)")
             return False
-
-        sql = self._construct_sql(
-            table, columns, table_conflict_columns, conflict_action
+        payload.write(_COPY_TRAILER)
+        payload.seek(0)
+
+        staging = f"{table}_staging"
+        sql = _construct_sql(
+            table,
+            staging,
+            tuple(columns),
+            _CONFLICT_COLS.get(table, ()),
+            conflict_action,
+            casts=tuple(casts.items()),
         )
         try:
-            conn.execute(text(sql), rows_to_insert)
+            conn.execute(
+                text(
+                    f"""
+                    CREATE TEMP TABLE {staging}
+                    ({', '.join(staging_columns)}) ON COMMIT DROP
+                """
+                )
+            )
+            with conn.connection.cursor() as cursor:
+                cursor.copy_expert(
+                    f"COPY {staging} ({', '.join(columns)}) FROM STDIN "
+                    "WITH (FORMAT binary)",
+                    payload,
+                )
+            conn.execute(sql)
+            conn.execute(text(f"DROP TABLE {staging}"))
             conn.commit()
             logger.info("✅ Data loading completed successfully")
             return True
@@ -252,24 +579,19 @@ class DatabaseManager:
             logger.error(f"Database error: {e}")
             raise
 
-    def _get_conflict_columns(self, table: str) -> list:
+    def _get_column_types(self, conn: Connection, table: str) -> dict:
         """
-        Get columns to check for conflict based on table name.
+        Look up the types of a table's columns.
 
         Args:
+            conn (Connection): Active database connection.
             table (str): Table name.
 
         Returns:
-            list: List of conflict columns.
+            dict: Column name -> (pg_type name, SQL type with modifiers).
         """
-        if table == "user_score":
-            return ["user_id", "anime_id"]
-        elif table == "anime_dataset":
-            return ["anime_id"]
-        elif table == "user_details":
-            return ["mal_id"]
-        else:
-            return []
+        result = conn.execute(_SELECT_COLUMN_TYPES, {"table": table})
+        return {name: (typname, sql_type) for name, typname, sql_type in result}
 
     def export_users_to_csv_buffer(
         self, table: str = "user_details"
@@ -277,149 +599,116 @@ class DatabaseManager:
         """
         Export user details to a CSV buffer.
 
+        The CSV is produced by the server with COPY ... TO STDOUT, user URLs
+        included, and written straight into the returned buffer.
+
         Args:
             table (str): Source table name.
 
         Returns:
             BytesIO: CSV buffer containing mal_id, username, and user_url.
         """
-        columns = ["mal_id", "username"]
-        query = f"SELECT {', '.join(columns)} FROM {table}"
-
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-        writer.writerow(["mal_id", "username", "user_url"])
+        query = f"""
+            COPY (
+                SELECT mal_id, username,
+                       'https://myanimelist.net/profile/' || username
+                           AS user_url
+                FROM {table}
+            ) TO STDOUT WITH (FORMAT csv, HEADER true)
+        """
 
+        buffer = BytesIO()
         with self.connection() as conn:
-            result = conn.execute(text(query))
-            for row in result.mappings():
-                mal_id = row.get("mal_id")
-                username = row.get("username")
-
-                user_url = f"https://myanimelist.net/profile/{username}"
-                writer.writerow([mal_id, username, user_url])
+            with conn.connection.cursor() as cursor:
+                cursor.copy_expert(query, buffer)
 
         buffer.seek(0)
-        return BytesIO(buffer.getvalue().encode("utf-8"))
+        return buffer
 
     def get_anime_ids_without_rules(self) -> Optional[list[int]]:
+        """
+        Devuelve los target_value que tienen como mucho 250 reglas.
 
-        # Nueva consulta: reglas cuyo target_value tenga <= 250 reglas
-        query_rules_targets = """
-            SELECT r.rule_id, r.target_value
-            FROM rules r
-            JOIN (
-                SELECT target_value
-                FROM rules
-                GROUP BY target_value
-                HAVING COUNT(*) <= 250
-            ) AS t ON r.target_value = t.target_value;
+        GROUP BY ya devuelve cada target una sola vez, así que basta con leer
+        la columna como escalares.
         """
         with self.connection() as conn:
-            # IDs de target_value en rules
-            result = conn.execute(text(query_rules_targets))
-            # Usar set comprehension directamente para eliminar duplicados
-            rule_targets = {row["target_value"] for row in result.mappings()}
-
-            # Retornar lista vacía si no hay elementos
-            return list(rule_targets)
-
+            return list(
+                conn.execute(_SELECT_TARGETS_WITH_FEW_RULES).scalars()
+            )
 
     def save_rules(self, rules: list[Rule], table: str = "rules") -> None:
         """
         Save Rule objects to the PostgreSQL database using normalized structure.
-        """
-        with self.connection() as conn:
-            try:
-                # Preparar datos para insertar en la tabla rules
-                rules_data = []
-                conditions_data = []
 
-                for rule in rules:
-                    rule_id = str(uuid.uuid4())
+        Rules and their conditions are built in a single pass. Small batches
+        are sent as two JSON arrays in one INSERT that Postgres expands with
+        json_populate_recordset; batches of `RULES_COPY_THRESHOLD` conditions
+        or more are loaded with COPY. Either way it is one transaction.
+        """
+        if not rules:
+            return
 
-                    # Datos para la tabla rules
-                    rules_data.append(
-                        {
-                            "rule_id": rule_id,
-                            "target_value": (
-                                int(rule.target.item())
-                                if hasattr(rule.target, "item")
-                                else int(rule.target)
-                            ),
-                        }
-                    )
+        use_copy = sum(map(len, rules)) >= RULES_COPY_THRESHOLD
+        null = "\\N" if use_copy else None
+        rule_rows = []
+        condition_rows = []
+        # IDs are 16 random bytes in hex, which the uuid columns accept as
+        # is; cheaper than building uuid.UUID objects
+        new_id = os.urandom
+
+        for rule in rules:
+            rule_id = new_id(16).hex()
+            rule_rows.append(
+                (
+                    rule_id,
+                    (
+                        int(rule.target.item())
+                        if hasattr(rule.target, "item")
+                        else int(rule.target)
+                    ),
+                )
+            )
 
-                    # Procesar user_conditions
-                    for col, (op, value) in rule.conditions[0]:
-                        condition_data = {
-                            "condition_id": str(uuid.uuid4()),
-                            "rule_id": rule_id,
-                            "table_name": "user_details",
-                            "column_name": col,
-                            "operator": op,
-                            "value_text": None,
-                            "value_numeric": None,
-                        }
-
-                        # Determinar el tipo de valor y asignarlo correctamente
-                        if isinstance(value, (int, float)):
-                            condition_data["value_numeric"] = value
-                        else:
-                            condition_data["value_text"] = str(value)
-
-                        conditions_data.append(condition_data)
-
-                    # Procesar other_conditions (anime_dataset)
-                    for col, (op, value) in rule.conditions[1]:
-                        condition_data = {
-                            "condition_id": str(uuid.uuid4()),
-                            "rule_id": rule_id,
-                            "table_name": "anime_dataset",
-                            "column_name": col,
-                            "operator": op,
-                            "value_text": None,
-                            "value_numeric": None,
-                        }
-
-                        # Determinar el tipo de valor y asignarlo correctamente
-                        if isinstance(value, (int, float)):
-                            condition_data["value_numeric"] = value
-                        else:
-                            condition_data["value_text"] = str(value)
-
-                        conditions_data.append(condition_data)
-
-                # Insertar reglas
-                if rules_data:
-                    conn.execute(
-                        text(
-                            f"""
-                            INSERT INTO {table} (rule_id, target_value)
-                            VALUES (:rule_id, :target_value)
-                        """
-                        ),
-                        rules_data,
+            # user_conditions -> user_details, other_conditions -> anime_dataset
+            for table_name, conditions in (
+                ("user_details", rule.conditions[0]),
+                ("anime_dataset", rule.conditions[1]),
+            ):
+                for col, (op, value) in conditions:
+                    # Valores numéricos en value_numeric, el resto como texto
+                    is_numeric = isinstance(value, (int, float))
+                    condition_rows.append(
+                        (
+                            new_id(16).hex(),
+                            rule_id,
+                            table_name,
+                            col,
+                            op,
+                            null if is_numeric else str(value),
+                            _numeric_value(value) if is_numeric else null,
+                        )
                     )
 
-                # Insertar condiciones
-                if conditions_data:
+        with self.connection() as conn:
+            try:
+                if use_copy:
+                    self._copy_rules(conn, table, rule_rows, condition_rows)
+                else:
                     conn.execute(
-                        text(
-                            """
-                            INSERT INTO rule_conditions 
-                            (condition_id, rule_id, table_name, column_name, operator, 
-                            value_text, value_numeric)
-                            VALUES (:condition_id, :rule_id, :table_name, :column_name, 
-                                    :operator, :value_text, :value_numeric)
-                        """
-                        ),
-                        conditions_data,
+                        _insert_rules_sql(table),
+                        {
+                            "rules": _records_json(
+                                ("rule_id", "target_value"), rule_rows
+                            ),
+                            "conditions": _records_json(
+                                _RULE_CONDITION_COLUMNS, condition_rows
+                            ),
+                        },
                     )
-
                 conn.commit()
                 logger.info(
-                    f"Guardadas {len(rules)} reglas con {len(conditions_data)} condiciones"
+                    f"Guardadas {len(rules)} reglas con {len(condition_rows)} condiciones"
                 )
 
             except Exception as e:
@@ -427,91 +716,113 @@ class DatabaseManager:
                 logger.error(f"Error guardando reglas: {e}")
                 raise
 
+    @staticmethod
+    def _copy_rules(
+        conn: Connection,
+        table: str,
+        rule_rows: list[tuple],
+        condition_rows: list[tuple],
+    ) -> None:
+        """
+        Load rule and condition rows with COPY on the current transaction.
+
+        Args:
+            conn (Connection): Connection with an open transaction.
+            table (str): Table that receives the rules.
+            rule_rows (list[tuple]): (rule_id, target_value) rows.
+            condition_rows (list[tuple]): Rows in `_RULE_CONDITION_COLUMNS`
+                order, with NULLs written as \\N.
+        """
+        rules_buffer = StringIO()
+        conditions_buffer = StringIO()
+        csv.writer(rules_buffer).writerows(rule_rows)
+        csv.writer(conditions_buffer).writerows(condition_rows)
+        rules_buffer.seek(0)
+        conditions_buffer.seek(0)
+
+        conn.begin()
+        with conn.connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {table} (rule_id, target_value) "
+                "FROM STDIN WITH (FORMAT csv)",
+                rules_buffer,
+            )
+            cursor.copy_expert(
+                f"""
+                COPY rule_conditions ({", ".join(_RULE_CONDITION_COLUMNS)})
+                FROM STDIN WITH (FORMAT csv, NULL '\\N')
+                """,
+                conditions_buffer,
+            )
+
     def get_rules_by_target_value_paginated(
-        self, target_value: int, offset: int = 0, limit: int = 500
+        self,
+        target_value: int,
+        last_rule_id: Optional[str] = None,
+        limit: int = 500,
     ) -> list[RuleWithID]:
         """
-        Devuelve todas las reglas asociadas a un target_value específico,
+        Devuelve una página de reglas asociadas a un target_value específico,
         en forma de lista de namedtuples con rule_id y objeto Rule.
+
+        La paginación es por clave (keyset): cada página empieza tras
+        `last_rule_id`, así que recorrer todas las reglas no re-escanea las
+        páginas anteriores como haría OFFSET.
+
+        Args:
+            target_value (int): Target de las reglas a recuperar.
+            last_rule_id (Optional[str]): rule_id de la última regla de la
+                página anterior, o None para la primera página.
+            limit (int): Número máximo de reglas por página.
+
+        Returns:
+            list[RuleWithID]: Reglas de la página ordenadas por rule_id.
         """
         with self.connection() as conn:
             try:
                 result = (
-                    conn.execute(
-                        text(
-                            """
-                            SELECT 
-                                r.rule_id, 
-                                r.target_value,
-                                rc.table_name,
-                                rc.column_name,
-                                rc.operator,
-                                rc.value_text,
-                                rc.value_numeric
-                            FROM rules r
-                            LEFT JOIN rule_conditions rc ON r.rule_id = rc.rule_id
-                            WHERE r.target_value = :target_value
-                            ORDER BY r.rule_id, rc.condition_id
-                            OFFSET :offset LIMIT :limit
-                        """
-                        ),
+                    conn.execution_options(
+                        stream_results=True, max_row_buffer=STREAM_BATCH_SIZE
+                    )
+                    .execute(
+                        _SELECT_RULES_BY_TARGET,
                         {
                             "target_value": target_value,
-                            "offset": offset,
+                            "last_rule_id": last_rule_id,
                             "limit": limit,
                         },
                     )
-                    .mappings()
-                    .all()
+                    .yield_per(STREAM_BATCH_SIZE)
+                    .tuples()
                 )
 
-                # Agrupar condiciones por regla
-                rules_dict = {}
-                for row in result:
-                    rule_id = row["rule_id"]
-
-                    if rule_id not in rules_dict:
-                        rules_dict[rule_id] = {
-                            "target_value": row["target_value"],
-                            "user_conditions": [],
-                            "other_conditions": [],
-                        }
-
-                    # Si hay condiciones (LEFT JOIN puede devolver None)
-                    if row["column_name"]:
+                # Las filas llegan ordenadas por rule_id: cada grupo es una regla
+                target = np.int64(target_value)
+                rules_with_id = []
+                for rule_id, rows in groupby(result, key=itemgetter(0)):
+                    user_conditions, other_conditions = [], []
+                    for _, table_name, column, op, numeric, text_value in rows:
+                        # Si hay condiciones (LEFT JOIN puede devolver None)
+                        if not column:
+                            continue
                         # Determinar el valor según el tipo
-                        if row["value_numeric"] is not None:
-                            value = row["value_numeric"]
-                        else:
-                            value = row["value_text"]
-
-                        condition = (
-                            row["column_name"],
-                            (row["operator"], value),
+                        value = text_value if numeric is None else numeric
+                        # Clasificar la condición según la tabla
+                        conds = (
+                            user_conditions
+                            if table_name == "user_details"
+                            else other_conditions  # anime_dataset
                         )
+                        conds.append((column, (op, value)))
 
-                        # Clasificar la condición según la tabla
-                        if row["table_name"] == "user_details":
-                            rules_dict[rule_id]["user_conditions"].append(
-                                condition
-                            )
-                        else:  # anime_dataset
-                            rules_dict[rule_id]["other_conditions"].append(
-                                condition
-                            )
-
-                # Convertir a objetos RuleWithID
-                rules_with_id = []
-                for rule_id, rule_data in rules_dict.items():
                     try:
-                        conditions = {
-                            "user_conditions": rule_data["user_conditions"],
-                            "other_conditions": rule_data["other_conditions"],
-                        }
                         rule = Rule(
                             columns=[],  # No se usa en la nueva implementación
-                            conditions=conditions,
-                            target=np.int64(rule_data["target_value"]),
+                            conditions={
+                                "user_conditions": user_conditions,
+                                "other_conditions": other_conditions,
+                            },
+                            target=target,
                         )
                         rules_with_id.append(
                             RuleWithID(rule_id=rule_id, rule_obj=rule)
@@ -538,23 +849,14 @@ class DatabaseManager:
         :return: List of dictionaries with the results.
         """
 
-
-        def clean_nans(obj):
-            if isinstance(obj, dict):
-                return {k: clean_nans(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [clean_nans(elem) for elem in obj]
-            elif isinstance(obj, float) and np.isnan(obj):
-                return None
-            return obj
-
-        cleaned_data = clean_nans(json_objeto)
+        # orjson writes NaN/Infinity as null, which is what the SQL expects
+        payload = orjson.dumps(
+            json_objeto,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ).decode()
         with self.connection() as conn:
             result = conn.execute(
-                text("SELECT * FROM get_rules_series(:input_json)").bindparams(
-                    bindparam("input_json", type_=JSONB)
-                ),
-                {"input_json": cleaned_data},
+                _SELECT_RULES_SERIES, {"input_json": payload}
             ).fetchall()
 
             if not result:
@@ -24,6 +24,11 @@ from genetic_rule_miner.utils.rule import Rule
 LogManager.configure()
 logger = LogManager.get_logger(__name__)
 
+_DELETE_RULES_BY_TARGET = text(
+    "DELETE FROM rules WHERE target_value = :target_id"
+)
+_DELETE_RULES_BY_ID = text("DELETE FROM rules WHERE rule_id = ANY(:ids)")
+
 
 def convert_text_to_list_column(df: pd.DataFrame, column_name: str) -> None:
     """
@@ -93,7 +98,7 @@ def remove_obsolete_rules_for_target(
             # Si el target no existe en los datos actuales, se eliminan todas sus reglas.
             if target_id not in merged_data["anime_id"].values:
                 conn.execute(
-                    text("DELETE FROM rules WHERE target_value = :target_id"),
+                    _DELETE_RULES_BY_TARGET,
                     {"target_id": target_id},
                 )
                 logger.info(
@@ -109,13 +114,14 @@ def remove_obsolete_rules_for_target(
 
             logger.info(f"Target {target_id}: {len(filtered_data)} filas en dataset")
 
-            offset = 0
+            last_rule_id = None
             while True:
                 rules_with_id = db_manager.get_rules_by_target_value_paginated(
-                    target_id, offset=offset, limit=BATCH_SIZE
+                    target_id, last_rule_id=last_rule_id, limit=BATCH_SIZE
                 )
                 if not rules_with_id:
                     break
+                last_rule_id = rules_with_id[-1].rule_id
 
                 miner = GeneticRuleMiner(
                     df=filtered_data,
@@ -128,8 +134,7 @@ def remove_obsolete_rules_for_target(
                 rules = [Rule.from_dict(r.rule_obj) for r in rules_with_id if isinstance(r.rule_obj, dict)]
 
                 if not rules:
-                    logger.info(f"No hay reglas válidas para target {target_id} en el batch actual (offset={offset}).")
-                    offset += BATCH_SIZE
+                    logger.info(f"No hay reglas válidas para target {target_id} en el batch actual (last_rule_id={last_rule_id}).")
                     continue
 
                 fitness_arr = miner.batch_vectorized_confidence(rules)
@@ -150,11 +155,9 @@ def remove_obsolete_rules_for_target(
                             f"Marcando para eliminación regla {rule_id} (fitness: {fitness:.4f}, soporte: {support:.4f})"
                         )
 
-                offset += BATCH_SIZE
-
             if to_delete:
                 conn.execute(
-                    text("DELETE FROM rules WHERE rule_id = ANY(:ids)"),
+                    _DELETE_RULES_BY_ID,
                     {"ids": to_delete},
                 )
                 logger.info(
@@ -15,7 +15,7 @@ from cachetools import LRUCache
 
 from genetic_rule_miner.data.database import DatabaseManager
 from genetic_rule_miner.utils.logging import LogManager
-from genetic_rule_miner.utils.rule import Condition, Rule
+from genetic_rule_miner.utils.rule import Condition, Rule, RulePopulation
 
 logger = LogManager.get_logger(__name__)
 
@@ -805,23 +805,18 @@ class GeneticRuleMiner:
         Filtra reglas dejando solo las más específicas (más condiciones).
         Si una regla es más general (subconjunto de otra), se descarta.
         """
-        filtered = []
-        for rule in rules:
-            is_more_general = False
-            to_remove = []
-            for i, other in enumerate(filtered):
-                if other.is_subset_of(rule):
-                    # other es más general, lo eliminamos
-                    to_remove.append(i)
-                elif rule.is_subset_of(other):
-                    # rule es más general, no la añadimos
-                    is_more_general = True
-                    break
-            if not is_more_general:
-                for idx in reversed(to_remove):
-                    del filtered[idx]
-                filtered.append(rule)
-        return filtered
+        if not rules:
+            return []
+        subset = RulePopulation(rules).is_subset_matrix()
+        filtered = np.empty(0, dtype=np.intp)
+        for i in range(len(rules)):
+            # Reglas ya aceptadas más generales que la nueva
+            generalizes = subset[filtered, i]
+            # La nueva es más general que alguna aceptada: no se añade
+            if (subset[i, filtered] & ~generalizes).any():
+                continue
+            filtered = np.append(filtered[~generalizes], i)
+        return [rules[i] for i in filtered]
 
     def evolve_per_target(
         self,
@@ -888,17 +883,17 @@ class GeneticRuleMiner:
 
         if self.db_manager is not None:
             all_existing_rules = []
-            offset = 0
+            last_rule_id = None
             page_size = 500  # ajusta según tus necesidades
 
             while True:
                 page = self.db_manager.get_rules_by_target_value_paginated(
-                    int(target_id), offset=offset, limit=page_size
+                    int(target_id), last_rule_id=last_rule_id, limit=page_size
                 )
                 if not page:
                     break  # No hay más datos
                 all_existing_rules.extend(page)
-                offset += page_size
+                last_rule_id = page[-1].rule_id
 
             existing_conditions_set = {
                 tuple(sorted(str(cond) for cond in r.rule_obj.conditions))
@@ -0,0 +1,340 @@
+"""Shared HTTP helpers for the external API services."""
+
+import asyncio
+import atexit
+import os
+import pickle
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Hashable, Optional
+
+import httpx
+import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+
+
+def build_session(pool_maxsize: int = 20) -> requests.Session:
+    """
+    Create a requests session backed by a pooled HTTP adapter.
+
+    Reusing one session keeps connections alive between calls, so only the
+    first request to a host pays the TCP and TLS handshake. Retries stay in
+    the services, which handle 404s and rate limits per endpoint.
+
+    Args:
+        pool_maxsize (int, optional): Connections kept open per host.
+            Defaults to 20.
+
+    Returns:
+        requests.Session: Session meant to be shared by a service instance.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=pool_maxsize, max_retries=0
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def build_http2_client(
+    timeout: float, max_connections: int = 20
+) -> httpx.Client:
+    """
+    Create a blocking HTTP client that negotiates HTTP/2 when offered.
+
+    Concurrent requests to the same host are multiplexed over a single
+    connection instead of each holding its own socket and TLS session.
+    Servers without HTTP/2 are served over pooled HTTP/1.1 connections.
+
+    Args:
+        timeout (float): Timeout in seconds for each request.
+        max_connections (int, optional): Upper bound on open connections.
+            Defaults to 20.
+
+    Returns:
+        httpx.Client: Thread-safe client meant to be shared by a service
+            instance.
+    """
+    return httpx.Client(
+        http2=True,
+        timeout=timeout,
+        limits=httpx.Limits(max_connections=max_connections),
+    )
+
+
+def build_async_http2_client(
+    timeout: float, max_connections: int = 20
+) -> httpx.AsyncClient:
+    """
+    Async counterpart of `build_http2_client`.
+
+    Args:
+        timeout (float): Timeout in seconds for each request.
+        max_connections (int, optional): Upper bound on open connections.
+            Defaults to 20.
+
+    Returns:
+        httpx.AsyncClient: Client to be used as an async context manager
+            within a single event loop.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=timeout,
+        limits=httpx.Limits(max_connections=max_connections),
+    )
+
+
+MISSING = object()
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL cache for results fetched from an external API.
+
+    Only definitive answers should be stored: a parsed payload, or None for
+    a resource the API reported as missing. Transient failures are left out
+    so they are retried on the next call.
+
+    Attributes:
+        maxsize (int): Maximum number of cached entries.
+        ttl (float): Seconds an entry stays valid.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Look up a cached result.
+
+        Args:
+            key (Hashable): Cache key, usually the requested ID or username.
+
+        Returns:
+            Any: The cached value, or `MISSING` when there is no fresh entry.
+        """
+        with self._lock:
+            return self._cache.get(key, MISSING)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a result.
+
+        Args:
+            key (Hashable): Cache key.
+            value (Any): Result to cache; None marks a known-missing resource.
+        """
+        with self._lock:
+            self._cache[key] = value
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter for blocking code.
+
+    Callers only wait when the bucket is empty, so time already spent on
+    the network counts towards the rate budget instead of adding a fixed
+    delay after every request.
+
+    Attributes:
+        rate (float): Requests allowed per `period`, also the burst size.
+        period (float): Length of the rate window in seconds.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent, then consume a token."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate,
+                    self._tokens + (now - self._last) * self.rate / self.period,
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.period / self.rate
+            time.sleep(wait)
+
+
+class NotFoundCache:
+    """
+    Persistent set of IDs the API reported as missing (404).
+
+    Lets range scans skip known gaps across runs instead of paying a round
+    trip for each. Entries expire after `ttl` so IDs past the current end of
+    the catalogue are probed again once new entries may exist. The set is
+    pickled to `path` every `flush_every` additions and at interpreter exit.
+
+    Attributes:
+        path (str): Pickle file holding ID -> time of the 404.
+        ttl (float): Seconds an ID is considered missing.
+        flush_every (int): Additions between writes to disk.
+    """
+
+    def __init__(self, path: str, ttl: float, flush_every: int = 100):
+        self.path = path
+        self.ttl = ttl
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._missing = self._load()
+        atexit.register(self.flush)
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "rb") as f:
+                missing = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return {}
+        cutoff = time.time() - self.ttl
+        return {key: ts for key, ts in missing.items() if ts > cutoff}
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            ts = self._missing.get(key)
+        return ts is not None and time.time() - ts < self.ttl
+
+    def add(self, key: Hashable) -> None:
+        """
+        Record an ID as missing.
+
+        Args:
+            key (Hashable): ID the API answered with a 404.
+        """
+        with self._lock:
+            self._missing[key] = time.time()
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._write()
+
+    def flush(self) -> None:
+        """Write pending additions to disk."""
+        with self._lock:
+            if self._pending:
+                self._write()
+
+    def _write(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self._missing, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+        self._pending = 0
+
+
+def is_terminal_status(status: int) -> bool:
+    """
+    Tell whether an HTTP error status is not worth retrying.
+
+    Client errors are permanent for the request that caused them, except
+    408 (request timeout) and 429 (rate limited). Server errors may be
+    transient and are retried.
+
+    Args:
+        status (int): HTTP status code of a failed response.
+
+    Returns:
+        bool: True if the request should be abandoned immediately.
+    """
+    return 400 <= status < 500 and status not in (408, 429)
+
+
+def _retry_after(response: Any) -> Optional[float]:
+    """
+    Read the server's Retry-After hint from a 429 response.
+
+    Works with requests and httpx responses, aiohttp responses and aiohttp
+    `ClientResponseError`, which all expose the status and headers.
+
+    Args:
+        response (Any): Response (or response error) to inspect.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None without a usable hint.
+    """
+    status = getattr(response, "status_code", None) or getattr(
+        response, "status", None
+    )
+    headers = getattr(response, "headers", None)
+    if status != 429 or not headers:
+        return None
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(
+    attempt: int, response: Any = None, base: float = 1.0
+) -> float:
+    """
+    Compute how long to wait before retrying a request.
+
+    A 429 carrying Retry-After is honoured as is. Otherwise the delay grows
+    exponentially with random jitter, so concurrent workers that failed
+    together do not retry in lockstep.
+
+    Args:
+        attempt (int): Zero-based number of the attempt that just failed.
+        response (Any, optional): Failed response, if there was one.
+        base (float, optional): Delay unit in seconds. Defaults to 1.0.
+
+    Returns:
+        float: Seconds to sleep.
+    """
+    if response is not None:
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            return retry_after
+    return (1 + random.random()) * 2**attempt * base
+
+
+def sleep_backoff(attempt: int, response: Any = None) -> None:
+    """
+    Block the current thread for the retry delay of `backoff_delay`.
+
+    Args:
+        attempt (int): Zero-based number of the attempt that just failed.
+        response (Any, optional): Failed response, if there was one.
+    """
+    time.sleep(backoff_delay(attempt, response))
+
+
+async def async_sleep_backoff(attempt: int, response: Any = None) -> None:
+    """
+    Suspend the current coroutine for the retry delay of `backoff_delay`.
+
+    Args:
+        attempt (int): Zero-based number of the attempt that just failed.
+        response (Any, optional): Failed response, if there was one.
+    """
+    await asyncio.sleep(backoff_delay(attempt, response))
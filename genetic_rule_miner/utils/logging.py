@@ -1,10 +1,12 @@
 """Advanced logging configuration with color support and performance monitoring."""
 
+import atexit
 import functools
 import logging
+import queue
 import time
 from dataclasses import dataclass
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Any, Dict, Optional
 
 # ANSI color codes for terminal output
@@ -51,10 +53,17 @@ class LogManager:
     """Centralized logging management with advanced features."""
 
     _configured: bool = False
+    _listener: Optional[QueueListener] = None
 
     @classmethod
     def configure(cls, settings: Optional[LogSettings] = None) -> None:
-        """Initialize logging system with specified settings."""
+        """
+        Initialize logging system with specified settings.
+
+        Loggers only enqueue records; a background listener thread formats
+        them and writes to the console and log file, so callers never block
+        on log I/O. The listener is drained and stopped at interpreter exit.
+        """
         if cls._configured:
             return
 
@@ -89,8 +98,21 @@ class LogManager:
             )
             handlers.append(file_handler)
 
+        # Hand records to a background thread that owns the real handlers
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        cls._listener = QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        cls._listener.start()
+        atexit.register(cls._listener.stop)
+
+        # The queue handler only renders the message; the listener's
+        # handlers apply the real formats
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
         # Basic configuration
-        logging.basicConfig(level=settings.level, handlers=handlers)
+        logging.basicConfig(level=settings.level, handlers=[queue_handler])
 
         # Configure third-party loggers
         cls._configure_external_loggers()
@@ -1,4 +1,11 @@
+import threading
+from collections import defaultdict
+from typing import Optional
+
 import nltk
+from rake_nltk import Rake
+
+_local = threading.local()
 
 
 def download_nltk_resources():
@@ -19,3 +26,76 @@ def download_nltk_resources():
         nltk.data.find("tokenizers/punkt_tab")
     except LookupError:
         nltk.download("punkt_tab")
+
+
+class LinearRake(Rake):
+    """
+    RAKE keyword extractor that computes word degrees in linear time.
+
+    rake-nltk derives degrees from a full word co-occurrence graph, which
+    costs O(L²) per phrase of length L. A word's degree is simply the summed
+    length of the phrases it occurs in, so it can be accumulated directly
+    with identical results.
+    """
+
+    def _build_word_co_occurance_graph(self, phrase_list) -> None:
+        degree = defaultdict(int)
+        for phrase in phrase_list:
+            length = len(phrase)
+            for word in phrase:
+                degree[word] += length
+        self.degree = degree
+
+
+def get_rake() -> LinearRake:
+    """
+    Return the keyword extractor owned by the current thread.
+
+    The English stopword list is loaded once per thread instead of on every
+    instantiation, and instances are never shared between threads because
+    RAKE keeps per-call state.
+
+    Returns:
+        LinearRake: Reusable extractor for the calling thread.
+    """
+    rake = getattr(_local, "rake", None)
+    if rake is None:
+        rake = LinearRake(
+            stopwords=set(nltk.corpus.stopwords.words("english"))
+        )
+        _local.rake = rake
+    return rake
+
+
+def extract_keywords(text: str) -> str:
+    """
+    Extract ranked keyword phrases from a text.
+
+    Args:
+        text (str): Free text, typically an anime synopsis.
+
+    Returns:
+        str: Ranked phrases joined with ", ".
+    """
+    rake = get_rake()
+    rake.extract_keywords_from_text(text)
+    return ", ".join(rake.get_ranked_phrases())
+
+
+def try_extract_keywords(text: str) -> tuple[str, Optional[str]]:
+    """
+    Extract keywords without raising, for use in worker processes.
+
+    Args:
+        text (str): Free text, typically an anime synopsis.
+
+    Returns:
+        tuple[str, Optional[str]]: The keywords (empty on failure) and the
+        error message, if any.
+    """
+    if not text:
+        return "", None
+    try:
+        return extract_keywords(text), None
+    except Exception as e:
+        return "", str(e)
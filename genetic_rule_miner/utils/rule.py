@@ -1,7 +1,35 @@
+import threading
 from typing import TypedDict
 
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; NumPy computes the same matrix
+    njit = None
+
+# Bit index of every (column, operator) pair seen so far. The vocabulary is
+# bounded by columns x operators, so condition blocks fit in a single int.
+_COND_VOCAB: dict[tuple[str, str], int] = {}
+_COND_VOCAB_LOCK = threading.Lock()
+
+
+def _cond_bits(conds) -> int:
+    """
+    Devuelve la máscara de bits de los pares (columna, operador) de un bloque.
+    """
+    bits = 0
+    for col, (op, _) in conds:
+        key = (col, op)
+        idx = _COND_VOCAB.get(key)
+        if idx is None:
+            # Miners run per target in threads; two new pairs must not
+            # share a bit
+            with _COND_VOCAB_LOCK:
+                idx = _COND_VOCAB.setdefault(key, len(_COND_VOCAB))
+        bits |= 1 << idx
+    return bits
+
 
 class Condition(TypedDict):
     """
@@ -31,13 +59,10 @@ class Rule:
             - other_conditions: list of tuples (column, (operator, value))
         target (np.int64): Target value that the rule predicts.
     """
-    """
-    Represents a rule for classification based on conditions on columns.
-    - columns: list of input column names (excluding target)
-    - conditions: dict with keys "user_conditions" and "other_conditions", each a list of tuples (col, (op, value))
-        or a list of Condition (TypedDict) for compatibility.
-    - target: target value that the rule predicts
-    """
+
+    # Populations hold many rules; slots drop the per-instance __dict__
+    __slots__ = ("columns", "target", "_conditions", "_sig", "_hash", "_bits")
+
     def __init__(
         self,
         columns: list[str],
@@ -63,8 +88,39 @@ class Rule:
 
         user_conditions = parse_conds(conditions.get("user_conditions", []))
         other_conditions = parse_conds(conditions.get("other_conditions", []))
-        self.conditions = (user_conditions, other_conditions)
         self.target = target
+        self.conditions = (user_conditions, other_conditions)
+
+    @property
+    def conditions(self) -> tuple[list[tuple], list[tuple]]:
+        """
+        Bloques de condiciones (user_conditions, other_conditions).
+
+        La firma y el hash se cachean, así que las listas solo pueden editarse
+        in situ si después se reasigna `conditions`, como hacen los operadores
+        genéticos tras deduplicar.
+        """
+        return self._conditions
+
+    @conditions.setter
+    def conditions(self, value: tuple[list[tuple], list[tuple]]) -> None:
+        self._conditions = value
+        self._sig = None
+        self._hash = None
+        self._bits = None
+
+    def __copy__(self) -> "Rule":
+        """
+        Copia superficial con listas de condiciones propias.
+
+        `mutate` edita las listas de la copia in situ; sin duplicarlas también
+        cambiaría la regla original y su firma cacheada quedaría obsoleta.
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.columns = self.columns
+        new.target = self.target
+        new.conditions = (list(self._conditions[0]), list(self._conditions[1]))
+        return new
 
     def __repr__(self):
         user_conds = [
@@ -88,6 +144,30 @@ class Rule:
         """
         return frozenset((col, op) for col, (op, _) in conds)
 
+    def __getstate__(self) -> tuple:
+        """
+        Estado para pickle sin la firma, el hash ni las máscaras cacheadas.
+
+        El hash de cadenas y el vocabulario de bits dependen del proceso, así
+        que se recalculan al cargar la regla.
+        """
+        return self.columns, self._conditions, self.target
+
+    def __setstate__(self, state: tuple) -> None:
+        self.columns, conditions, self.target = state
+        self.conditions = conditions
+
+    def _block_bits(self) -> tuple[int, int]:
+        """
+        Devuelve las máscaras de bits (user, other), cacheadas como la firma.
+        """
+        if self._bits is None:
+            self._bits = (
+                _cond_bits(self._conditions[0]),
+                _cond_bits(self._conditions[1]),
+            )
+        return self._bits
+
     @classmethod
     def from_dict(cls, data: dict) -> "Rule":
         """
@@ -109,17 +189,19 @@ class Rule:
         """
         Devuelve la firma de la regla como frozensets de condiciones y target.
 
+        Se calcula en el primer acceso y se reutiliza hasta que se reasignan
+        las condiciones.
+
         Returns:
             tuple: (user_conditions_frozenset, other_conditions_frozenset, target)
         """
-        """
-        Devuelve la firma de la regla como dos frozensets: uno para user_conditions y otro para other_conditions.
-        """
-        return (
-            self._cond_key_set(self.conditions[0]),
-            self._cond_key_set(self.conditions[1]),
-            self.target,
-        )
+        if self._sig is None:
+            self._sig = (
+                self._cond_key_set(self._conditions[0]),
+                self._cond_key_set(self._conditions[1]),
+                self.target,
+            )
+        return self._sig
 
     def __eq__(self, other):
         """Define igualdad basada en condiciones y target."""
@@ -130,7 +212,9 @@ class Rule:
 
     def __hash__(self):
         """Hash basado en la firma de condiciones y target."""
-        return hash(self.cond_signature())
+        if self._hash is None:
+            self._hash = hash(self.cond_signature())
+        return self._hash
 
     def is_subset_of(self, other: "Rule") -> bool:
         """
@@ -145,14 +229,13 @@ class Rule:
         Returns:
             bool: True si es subconjunto, False en caso contrario.
         """
-        
         if self.target != other.target:
             return False
-        user_self, other_self, _ = self.cond_signature()
-        user_other, other_other, _ = other.cond_signature()
-        return user_self.issubset(user_other) and other_self.issubset(
-            other_other
-        )
+        user_self, other_self = self._block_bits()
+        user_other, other_other = other._block_bits()
+        return (user_self & user_other) == user_self and (
+            other_self & other_other
+        ) == other_self
 
     def is_more_specific_than(self, other: "Rule") -> bool:
         """
@@ -166,10 +249,104 @@ class Rule:
         Returns:
             bool: True si es más específica, False en caso contrario.
         """
-        
         if not self.is_subset_of(other):
             return False
         # Más específica si tiene más condiciones totales
-        return len(self.conditions[0]) + len(self.conditions[1]) > len(
-            other.conditions[0]
-        ) + len(other.conditions[1])
+        return len(self) > len(other)
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _subset_matrix_jit(user_bits, other_bits, targets):
+        """
+        Matriz de subconjuntos en una sola pasada, repartiendo filas entre núcleos.
+        """
+        n, n_words = user_bits.shape
+        result = np.zeros((n, n), dtype=np.bool_)
+        for i in prange(n):
+            for j in range(n):
+                if targets[i] != targets[j]:
+                    continue
+                is_subset = True
+                for k in range(n_words):
+                    user, other = user_bits[i, k], other_bits[i, k]
+                    if (user & user_bits[j, k]) != user or (
+                        other & other_bits[j, k]
+                    ) != other:
+                        is_subset = False
+                        break
+                result[i, j] = is_subset
+        return result
+
+
+class RulePopulation:
+    """
+    Column-oriented view of a list of rules for batched dominance checks.
+
+    Each rule's condition blocks are stored as rows of packed uint64 words
+    (the same (column, operator) bits `Rule` uses), so subset tests for the
+    whole population run as NumPy bitwise operations.
+
+    Attributes:
+        rules (list[Rule]): Rules in the order of the array rows.
+        user_bits (np.ndarray): (N, W) uint64 masks of user_conditions.
+        other_bits (np.ndarray): (N, W) uint64 masks of other_conditions.
+        targets (np.ndarray): (N,) target of each rule.
+    """
+
+    def __init__(self, rules: list[Rule]):
+        self.rules = list(rules)
+        masks = [rule._block_bits() for rule in self.rules]
+        n_bits = max(
+            (mask.bit_length() for pair in masks for mask in pair), default=0
+        )
+        n_bytes = 8 * max(1, -(-n_bits // 64))
+        self.user_bits = self._pack([user for user, _ in masks], n_bytes)
+        self.other_bits = self._pack([other for _, other in masks], n_bytes)
+        self.targets = np.array(
+            [rule.target for rule in self.rules], dtype=np.int64
+        )
+
+    def __len__(self):
+        return len(self.rules)
+
+    @staticmethod
+    def _pack(masks: list[int], n_bytes: int) -> np.ndarray:
+        """
+        Convierte máscaras enteras en una matriz (N, W) de palabras uint64.
+        """
+        data = b"".join(mask.to_bytes(n_bytes, "little") for mask in masks)
+        return np.frombuffer(data, dtype="<u8").reshape(
+            len(masks), n_bytes // 8
+        )
+
+    @staticmethod
+    def _subset_words(bits: np.ndarray) -> np.ndarray:
+        """
+        Devuelve la matriz booleana M[i, j] = bits[i] ⊆ bits[j].
+        """
+        result = np.ones((len(bits), len(bits)), dtype=bool)
+        # Palabra a palabra para no materializar un tensor (N, N, W)
+        for word in bits.T:
+            result &= (word[:, None] & word[None, :]) == word[:, None]
+        return result
+
+    def is_subset_matrix(self) -> np.ndarray:
+        """
+        Devuelve M[i, j] = rules[i].is_subset_of(rules[j]) para todos los pares.
+
+        Con numba instalado se calcula en una pasada compilada y paralela.
+
+        Returns:
+            np.ndarray: Matriz booleana (N, N).
+        """
+        if njit is not None:
+            return _subset_matrix_jit(
+                self.user_bits, self.other_bits, self.targets
+            )
+        return (
+            (self.targets[:, None] == self.targets[None, :])
+            & self._subset_words(self.user_bits)
+            & self._subset_words(self.other_bits)
+        )
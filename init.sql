@@ -84,8 +84,8 @@ CREATE INDEX idx_rule_conditions_rule_id ON rule_conditions(rule_id);
 -- Índice para optimizar consultas que filtran por tabla y columna
 CREATE INDEX idx_rule_conditions_table_column ON rule_conditions(table_name, column_name);
 
--- Índice para optimizar consultas que ordenan o filtran por target_value en rules
-CREATE INDEX idx_rules_target_value ON rules(target_value);
+-- Índice para filtrar por target_value y paginar por rule_id (keyset) en rules
+CREATE INDEX idx_rules_target_value_rule_id ON rules(target_value, rule_id);
 
 DROP FUNCTION IF EXISTS get_rules_series;
 
@@ -0,0 +1,102 @@
+import csv
+import math
+from contextlib import contextmanager
+from io import StringIO
+
+import numpy as np
+import orjson
+import pytest
+
+from genetic_rule_miner.data import database
+from genetic_rule_miner.data.database import DatabaseManager
+from genetic_rule_miner.utils.rule import Rule
+
+
+class FakeCursor:
+    def __init__(self, copies):
+        self.copies = copies
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def copy_expert(self, sql, buffer):
+        self.copies.append((sql, buffer.getvalue()))
+
+
+class FakeConnection:
+    def __init__(self):
+        self.executed = []
+        self.copies = []
+        self.connection = self
+
+    def cursor(self):
+        return FakeCursor(self.copies)
+
+    def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+
+    def begin(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    conn = FakeConnection()
+    manager = object.__new__(DatabaseManager)
+
+    @contextmanager
+    def connection():
+        yield conn
+
+    monkeypatch.setattr(manager, "connection", connection)
+    return manager, conn
+
+
+def _nan_rule():
+    return Rule(
+        columns=[],
+        conditions={
+            "user_conditions": [("mean_score", (">=", math.nan))],
+            "other_conditions": [("status", ("==", "Finished Airing"))],
+        },
+        target=np.int64(1),
+    )
+
+
+def _json_conditions(conn):
+    _, params = conn.executed[0]
+    return [
+        (row["value_text"], row["value_numeric"])
+        for row in orjson.loads(params["conditions"])
+    ]
+
+
+def _copy_conditions(conn):
+    _, payload = conn.copies[1]
+    return [
+        (row[5], row[6]) for row in csv.reader(StringIO(payload))
+    ]
+
+
+def test_save_rules_stores_nan_threshold_alike_in_both_paths(
+    manager, monkeypatch
+):
+    manager, conn = manager
+    manager.save_rules([_nan_rule()])
+    json_values = _json_conditions(conn)
+
+    monkeypatch.setattr(database, "RULES_COPY_THRESHOLD", 1)
+    manager.save_rules([_nan_rule()])
+    copy_values = _copy_conditions(conn)
+
+    assert json_values == [(None, "NaN"), ("Finished Airing", None)]
+    assert copy_values == [("\\N", "NaN"), ("Finished Airing", "\\N")]